@@ -21,14 +21,16 @@ from typing import Dict, List, Optional, Tuple, Any
 class DataManager:
     """Handles data loading, cleaning, and basic operations."""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, df: Optional[pd.DataFrame] = None):
         """
         Initialize DataManager with file path.
         
         Args:
-            file_path: Path to the CSV data file
+            file_path: Path to the CSV (or Arrow/Feather) data file
+            df: Already loaded data; when given, file_path is not read
         """
         self.file_path = file_path
+        self._preloaded = df
         self.df = None
         self.original_count = 0
         
@@ -36,7 +38,12 @@ class DataManager:
         """Load and clean the book data"""
         print("📚 Loading book data...")
         try:
-            self.df = pd.read_csv(self.file_path)
+            if self._preloaded is not None:
+                self.df = self._preloaded
+            elif str(self.file_path).endswith(('.arrow', '.feather')):
+                self.df = pd.read_feather(self.file_path)
+            else:
+                self.df = pd.read_csv(self.file_path)
             self.original_count = len(self.df)
             print(f"✓ Loaded {self.df.shape[0]} books with {self.df.shape[1]} features")
             
@@ -733,17 +740,18 @@ class BookPricePredictionSystem:
     to complex subsystems of analysis components.
     """
     
-    def __init__(self, file_path: str, output_dir: str = '../data'):
+    def __init__(self, file_path: str, output_dir: str = '../data', df: Optional[pd.DataFrame] = None):
         """
         Initialize the prediction system.
         
         Args:
-            file_path: Path to the CSV data file
+            file_path: Path to the CSV (or Arrow/Feather) data file
             output_dir: Directory to save reports
+            df: Already loaded data; when given, file_path is not read
         """
         self.file_path = file_path
         self.output_dir = output_dir
-        self.data_manager = DataManager(file_path)
+        self.data_manager = DataManager(file_path, df)
         self.report_generator = ReportGenerator(output_dir)
         self.analyzers = {}
         self.data = None
@@ -9,40 +9,84 @@ Author: GitHub Copilot
 Date: September 2025
 """
 
+import io
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import logging
 import json
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Set
 from scipy.stats import ttest_ind
 
+try:
+    # Optional: Rust JSON serializer with native NumPy support, used when installed
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class NpEncoder(json.JSONEncoder):
+    """JSON encoder that converts NumPy scalars and arrays to native Python types."""
+
+    def default(self, obj):
+        if isinstance(obj, np.integer):
+            return int(obj)
+        if isinstance(obj, np.floating):
+            return float(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.bool_):
+            return bool(obj)
+        return super(NpEncoder, self).default(obj)
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Recursively replace NaN/infinite floats with None, matching orjson's null output."""
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _replace_non_finite(obj.tolist())
+    if isinstance(obj, (float, np.floating)) and not np.isfinite(obj):
+        return None
+    return obj
+
+
 class BookDataAnalyzer:
     """
     A simplified book data analyzer that performs key statistical analyses and
     generates a comprehensive report.
     """
     
-    def __init__(self, data_path: str):
+    def __init__(self, data_path: str, df: Optional[pd.DataFrame] = None):
         """
         Initialize the analyzer and load data.
         
         Args:
-            data_path: Path to the cleaned CSV data file.
+            data_path: Path to the cleaned CSV (or Arrow/Feather) data file.
+            df: Already loaded cleaned data; when given, data_path is not read
+                and is only reported as the source file.
         """
         self.data_path = data_path
-        self.df = self._load_data()
+        self.df = self._load_data(df)
+        self._ensured_dirs: Set[Path] = set()
         
-    def _load_data(self) -> pd.DataFrame:
-        """Loads data from the specified CSV file."""
+    def _load_data(self, df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Loads data from the specified CSV (or Arrow/Feather) file unless a DataFrame is given."""
         try:
-            df = pd.read_csv(self.data_path)
+            if df is not None:
+                # Shallow copy: columns added here don't leak into the caller's frame
+                df = df.copy(deep=False)
+            elif str(self.data_path).endswith(('.arrow', '.feather')):
+                df = pd.read_feather(self.data_path)
+            else:
+                df = pd.read_csv(self.data_path)
             logger.info(f"Successfully loaded {len(df)} records from {self.data_path}")
             
             if 'rating' not in df.columns and 'rating_num' in df.columns:
@@ -89,48 +133,41 @@ class BookDataAnalyzer:
         for col in ['price', 'rating']:
             if col in self.df.columns:
                 series = self.df[col]
-                stats = {
-                    'mean': series.mean(),
-                    'median': series.median(),
-                    'mode': series.mode().iloc[0] if not series.mode().empty else 'N/A',
-                    'std_dev': series.std(),
-                    'min': series.min(),
-                    'max': series.max()
+                summary = series.agg(['mean', 'median', 'std', 'min', 'max']).round(2)
+                mode = series.mode()
+                report['descriptive_stats'][col] = {
+                    'mean': summary['mean'],
+                    'median': summary['median'],
+                    'mode': round(mode.iloc[0], 2) if not mode.empty else 'N/A',
+                    'std_dev': summary['std'],
+                    'min': summary['min'],
+                    'max': summary['max']
                 }
-                report['descriptive_stats'][col] = {k: round(v, 2) if isinstance(v, (int, float)) else v for k, v in stats.items()}
 
         # 2. Price Distribution Analysis Across Categories
         if 'category' in self.df.columns and 'price' in self.df.columns:
-            category_price_stats = {}
-            for category, group in self.df.groupby('category'):
-                price_series = group['price']
-                category_price_stats[category] = {
-                    'count': len(price_series),
-                    'mean_price': round(price_series.mean(), 2),
-                    'median_price': round(price_series.median(), 2),
-                    'std_dev': round(price_series.std(), 2),
-                    'min_price': round(price_series.min(), 2),
-                    'max_price': round(price_series.max(), 2),
-                    'price_range': round(price_series.max() - price_series.min(), 2)
-                }
-            report['price_distribution_by_category'] = category_price_stats
+            category_price_stats = self.df.groupby('category')['price'].agg(
+                count='size', mean_price='mean', median_price='median',
+                std_dev='std', min_price='min', max_price='max'
+            )
+            category_price_stats['price_range'] = category_price_stats['max_price'] - category_price_stats['min_price']
+            report['price_distribution_by_category'] = category_price_stats.round(2).to_dict('index')
 
         # 3. Rating Patterns and Statistical Summaries
         if 'rating' in self.df.columns:
             rating_series = self.df['rating']
             rating_freq = rating_series.value_counts().sort_index()
+            rating_spread = rating_series.agg(['std', 'skew']).round(2)
             
             report['rating_patterns'] = {
                 'rating_distribution': rating_freq.to_dict(),
                 'most_common_rating': rating_freq.index[0],
-                'rating_variability': round(rating_series.std(), 2),
-                'rating_skewness': round(rating_series.skew(), 2),
-                'rating_percentiles': {
-                    '25th': round(rating_series.quantile(0.25), 2),
-                    '50th': round(rating_series.quantile(0.50), 2),
-                    '75th': round(rating_series.quantile(0.75), 2),
-                    '90th': round(rating_series.quantile(0.90), 2)
-                }
+                'rating_variability': rating_spread['std'],
+                'rating_skewness': rating_spread['skew'],
+                'rating_percentiles': dict(zip(
+                    ['25th', '50th', '75th', '90th'],
+                    rating_series.quantile([0.25, 0.50, 0.75, 0.90]).round(2).tolist()
+                ))
             }
 
         # 4. Correlation Analysis (Price, Rating, and Availability if available)
@@ -164,18 +201,21 @@ class BookDataAnalyzer:
 
         # 5. Category Popularity Analysis (Frequency Distributions)
         if 'category' in self.df.columns:
-            category_freq = self.df['category'].value_counts()
-            category_percent = (category_freq / len(self.df) * 100).round(2)
-            
+            # value_counts is sorted descending, so every summary below is a slice of one array
+            category_freq = self.df['category'].value_counts(sort=True)
+            categories = category_freq.index.tolist()
+            freq_values = category_freq.to_numpy()
+            percent_values = (freq_values * (100.0 / len(self.df))).round(2)
+
             report['category_popularity'] = {
-                'frequency_distribution': category_freq.to_dict(),
-                'percentage_distribution': category_percent.to_dict(),
-                'total_categories': len(category_freq),
-                'most_popular_category': category_freq.index[0],
-                'least_popular_category': category_freq.index[-1],
+                'frequency_distribution': dict(zip(categories, freq_values.tolist())),
+                'percentage_distribution': dict(zip(categories, percent_values.tolist())),
+                'total_categories': len(categories),
+                'most_popular_category': categories[0],
+                'least_popular_category': categories[-1],
                 'category_concentration': {
-                    'top_3_categories_percentage': category_percent.head(3).sum(),
-                    'bottom_categories_count': len(category_freq[category_freq <= 1])
+                    'top_3_categories_percentage': float(percent_values[:3].sum()),
+                    'bottom_categories_count': int((freq_values <= 1).sum())
                 }
             }
 
@@ -190,38 +230,49 @@ class BookDataAnalyzer:
             comparative_stats = {}
             
             if not fiction_data.empty and not nonfiction_data.empty:
-                for col in ['price', 'rating']:
-                    if col in fiction_data.columns and col in nonfiction_data.columns:
-                        comparative_stats[f'{col}_comparison'] = {
-                            'fiction': {
-                                'count': len(fiction_data),
-                                'mean': round(fiction_data[col].mean(), 2),
-                                'std': round(fiction_data[col].std(), 2)
-                            },
-                            'non_fiction': {
-                                'count': len(nonfiction_data),
-                                'mean': round(nonfiction_data[col].mean(), 2),
-                                'std': round(nonfiction_data[col].std(), 2)
-                            },
-                            'difference': round(fiction_data[col].mean() - nonfiction_data[col].mean(), 2)
-                        }
+                compare_cols = [col for col in ['price', 'rating'] if col in self.df.columns]
+                segment_stats = self.df.groupby(fiction_mask)[compare_cols].agg(['mean', 'std'])
+                mean_difference = (segment_stats.loc[True] - segment_stats.loc[False]).round(2)
+                segment_stats = segment_stats.round(2)
+                for col in compare_cols:
+                    comparative_stats[f'{col}_comparison'] = {
+                        'fiction': {
+                            'count': len(fiction_data),
+                            'mean': segment_stats.loc[True, (col, 'mean')],
+                            'std': segment_stats.loc[True, (col, 'std')]
+                        },
+                        'non_fiction': {
+                            'count': len(nonfiction_data),
+                            'mean': segment_stats.loc[False, (col, 'mean')],
+                            'std': segment_stats.loc[False, (col, 'std')]
+                        },
+                        'difference': mean_difference[(col, 'mean')]
+                    }
             
             # Compare by price ranges
             if 'price' in self.df.columns:
                 price_quartiles = self.df['price'].quantile([0.25, 0.5, 0.75])
                 cheap_books = self.df[self.df['price'] <= price_quartiles[0.25]]
                 expensive_books = self.df[self.df['price'] >= price_quartiles[0.75]]
+                price_quartiles = price_quartiles.round(2)
+                if 'rating' in self.df.columns:
+                    avg_ratings = pd.Series({
+                        'cheap': cheap_books['rating'].mean(),
+                        'expensive': expensive_books['rating'].mean()
+                    }).round(2)
+                else:
+                    avg_ratings = {'cheap': 'N/A', 'expensive': 'N/A'}
                 
                 comparative_stats['price_range_comparison'] = {
                     'cheap_books': {
                         'count': len(cheap_books),
-                        'avg_rating': round(cheap_books['rating'].mean(), 2) if 'rating' in cheap_books.columns else 'N/A',
-                        'price_threshold': round(price_quartiles[0.25], 2)
+                        'avg_rating': avg_ratings['cheap'],
+                        'price_threshold': price_quartiles[0.25]
                     },
                     'expensive_books': {
                         'count': len(expensive_books),
-                        'avg_rating': round(expensive_books['rating'].mean(), 2) if 'rating' in expensive_books.columns else 'N/A',
-                        'price_threshold': round(price_quartiles[0.75], 2)
+                        'avg_rating': avg_ratings['expensive'],
+                        'price_threshold': price_quartiles[0.75]
                     }
                 }
             
@@ -244,17 +295,19 @@ class BookDataAnalyzer:
 
         # 8. Hypothesis Testing (Fiction vs. Non-Fiction prices)
         if 'category' in self.df.columns:
-            fiction_prices = self.df[self.df['category'].str.contains('Fiction', case=False, na=False)]['price']
-            non_fiction_prices = self.df[~self.df['category'].str.contains('Fiction', case=False, na=False)]['price']
+            is_fiction = self.df['category'].str.contains('Fiction', case=False, na=False)
+            fiction_prices = self.df.loc[is_fiction, 'price']
+            non_fiction_prices = self.df.loc[~is_fiction, 'price']
             
             if not fiction_prices.empty and not non_fiction_prices.empty:
+                mean_prices = self.df['price'].groupby(is_fiction).mean().round(2)
                 stat, p_value = ttest_ind(fiction_prices, non_fiction_prices, equal_var=False, nan_policy='omit')
                 report['hypothesis_testing']['fiction_vs_nonfiction_price'] = {
                     't_statistic': round(stat, 3),
                     'p_value': round(p_value, 3),
                     'is_significant_at_0.05': p_value < 0.05,
-                    'fiction_mean_price': round(fiction_prices.mean(), 2),
-                    'non_fiction_mean_price': round(non_fiction_prices.mean(), 2)
+                    'fiction_mean_price': mean_prices[True],
+                    'non_fiction_mean_price': mean_prices[False]
                 }
 
         logger.info("Comprehensive report generated successfully.")
@@ -265,23 +318,28 @@ class BookDataAnalyzer:
         Saves the analysis report to a file (JSON or Markdown).
         """
         output_path = Path(output_path).resolve()
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only create each output directory once per analyzer
+        if output_path.parent not in self._ensured_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_path.parent)
 
         if format == 'json':
-            # Custom JSON encoder to handle NumPy data types
-            class NpEncoder(json.JSONEncoder):
-                def default(self, obj):
-                    if isinstance(obj, np.integer):
-                        return int(obj)
-                    if isinstance(obj, np.floating):
-                        return float(obj)
-                    if isinstance(obj, np.ndarray):
-                        return obj.tolist()
-                    if isinstance(obj, np.bool_):
-                        return bool(obj)
-                    return super(NpEncoder, self).default(obj)
-            with open(output_path, 'w') as f:
-                json.dump(report, f, indent=4, cls=NpEncoder)
+            if orjson is not None:
+                # NaN values are written as null (valid JSON) rather than NaN
+                body = orjson.dumps(
+                    report,
+                    default=NpEncoder().default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                )
+                with open(output_path, 'wb') as f:
+                    f.write(body)
+            else:
+                # Same layout as the orjson output: 2-space indent, UTF-8, NaN as null.
+                # Serialize in one pass and write once; json.dump issues a write per token
+                body = json.dumps(_replace_non_finite(report), indent=2, cls=NpEncoder,
+                                  ensure_ascii=False, allow_nan=False)
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(body)
         elif format == 'markdown':
             with open(output_path, 'w') as f:
                 f.write(self._format_report_to_markdown(report))
@@ -293,65 +351,65 @@ class BookDataAnalyzer:
 
     def _format_report_to_markdown(self, report: Dict[str, Any]) -> str:
         """Converts the report dictionary to a Markdown string."""
-        lines = [f"# Analysis Report - {datetime.now().strftime('%Y-%m-%d %H:%M')}\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Analysis Report - {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n")
 
         # Metadata
         meta = report.get('metadata', {})
-        lines.append("## 1. Overview\n")
-        lines.append(f"- **Source File**: `{meta.get('source_file', 'N/A')}`")
-        lines.append(f"- **Total Records**: {meta.get('total_records', 'N/A')}\n")
+        w("## 1. Overview\n\n")
+        w(f"- **Source File**: `{meta.get('source_file', 'N/A')}`\n")
+        w(f"- **Total Records**: {meta.get('total_records', 'N/A')}\n\n")
 
         # Descriptive Stats
         stats = report.get('descriptive_stats', {})
         if stats:
-            lines.append("## 2. Descriptive Statistics\n")
+            w("## 2. Descriptive Statistics\n\n")
             for col, data in stats.items():
-                lines.append(f"### {col.title()} Statistics\n")
-                lines.append("| Metric | Value |")
-                lines.append("|--------|-------|")
-                for metric, value in data.items():
-                    lines.append(f"| {metric.replace('_', ' ').title()} | {value} |")
-                lines.append("")
+                w(f"### {col.title()} Statistics\n\n")
+                w("| Metric | Value |\n")
+                w("|--------|-------|\n")
+                w("".join(f"| {metric.replace('_', ' ').title()} | {value} |\n" for metric, value in data.items()))
+                w("\n")
 
         # Outlier Analysis
         outliers = report.get('outlier_analysis', {})
         if outliers:
-            lines.append("## 3. Outlier Analysis (IQR Method)\n")
+            w("## 3. Outlier Analysis (IQR Method)\n\n")
             for col, data in outliers.items():
-                lines.append(f"- **{col.title()} Outliers**: {data.get('count')} ({data.get('percentage')}%)")
-            lines.append("")
+                w(f"- **{col.title()} Outliers**: {data.get('count')} ({data.get('percentage')}%)\n")
+            w("\n")
 
         # Category Analysis
         cat_analysis = report.get('category_analysis', {})
         if cat_analysis:
-            lines.append("## 4. Category Frequency Distribution\n")
-            lines.append(f"- **Total Unique Categories**: {cat_analysis.get('total_categories', 'N/A')}")
-            lines.append(f"- **Most Popular**: {cat_analysis.get('most_popular_category', 'N/A')}\n")
-            lines.append("### Top 5 Categories\n")
-            lines.append("| Category | Count |")
-            lines.append("|----------|-------|")
-            for cat, count in cat_analysis.get('top_5_categories', {}).items():
-                lines.append(f"| {cat} | {count} |")
-            lines.append("")
+            w("## 4. Category Frequency Distribution\n\n")
+            w(f"- **Total Unique Categories**: {cat_analysis.get('total_categories', 'N/A')}\n")
+            w(f"- **Most Popular**: {cat_analysis.get('most_popular_category', 'N/A')}\n\n")
+            w("### Top 5 Categories\n\n")
+            w("| Category | Count |\n")
+            w("|----------|-------|\n")
+            w("".join(f"| {cat} | {count} |\n" for cat, count in cat_analysis.get('top_5_categories', {}).items()))
+            w("\n")
 
         # Correlation Analysis
         corr = report.get('correlation_analysis', {})
         if corr:
-            lines.append("## 5. Correlation Analysis\n")
-            lines.append(f"- **Price vs. Rating Correlation**: {corr.get('price_vs_rating_correlation', 'N/A')}\n")
+            w("## 5. Correlation Analysis\n\n")
+            w(f"- **Price vs. Rating Correlation**: {corr.get('price_vs_rating_correlation', 'N/A')}\n\n")
 
         # Hypothesis Testing
         hypo = report.get('hypothesis_testing', {})
         if hypo.get('fiction_vs_nonfiction_price'):
             test_results = hypo['fiction_vs_nonfiction_price']
-            lines.append("## 6. Hypothesis Testing: Fiction vs. Non-Fiction Prices\n")
-            lines.append(f"- **T-statistic**: {test_results['t_statistic']}")
-            lines.append(f"- **P-value**: {test_results['p_value']}")
-            lines.append(f"- **Result**: {'Significant difference' if test_results['is_significant_at_0.05'] else 'No significant difference'} found at the 0.05 level.")
-            lines.append(f"- **Mean Price (Fiction)**: £{test_results['fiction_mean_price']}")
-            lines.append(f"- **Mean Price (Non-Fiction)**: £{test_results['non_fiction_mean_price']}\n")
+            w("## 6. Hypothesis Testing: Fiction vs. Non-Fiction Prices\n\n")
+            w(f"- **T-statistic**: {test_results['t_statistic']}\n")
+            w(f"- **P-value**: {test_results['p_value']}\n")
+            w(f"- **Result**: {'Significant difference' if test_results['is_significant_at_0.05'] else 'No significant difference'} found at the 0.05 level.\n")
+            w(f"- **Mean Price (Fiction)**: £{test_results['fiction_mean_price']}\n")
+            w(f"- **Mean Price (Non-Fiction)**: £{test_results['non_fiction_mean_price']}\n\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
 
 def main():
@@ -387,19 +445,6 @@ def main():
         
         print("\n--- Report Summary ---")
         
-        # Custom JSON encoder for printing
-        class NpEncoder(json.JSONEncoder):
-            def default(self, obj):
-                if isinstance(obj, np.integer):
-                    return int(obj)
-                if isinstance(obj, np.floating):
-                    return float(obj)
-                if isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                if isinstance(obj, np.bool_):
-                    return bool(obj)
-                return super(NpEncoder, self).default(obj)
-        
         print(json.dumps(report_data, indent=2, cls=NpEncoder))
 
     except Exception as e:
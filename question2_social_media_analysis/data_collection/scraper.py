@@ -9,15 +9,109 @@ and saves the data to a CSV file.
 import csv
 import logging
 import os
-import random
 import re
-import time
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    # Optional: persist responses between runs so re-scrapes are served from disk
+    # (opt-in, see BookScraper's use_cache)
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+try:
+    # Optional: only needed when writing Parquet output
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Keep-alive sockets kept per host; BookScraper.max_workers should not exceed it
+POOL_MAXSIZE = 64
+
+# One CSV row: (title, price, rating, availability, category)
+BookRow = Tuple[str, str, int, int, str]
+
+# Column types for Parquet output, in the same order as a BookRow
+_PARQUET_SCHEMA = pa.schema([
+    ('title', pa.string()),
+    ('price', pa.string()),
+    ('rating', pa.int8()),
+    ('availability', pa.int32()),
+    ('category', pa.dictionary(pa.int32(), pa.string()))
+]) if pa is not None else None
+
+# Environment variable that turns on the response cache when use_cache is not given
+CACHE_ENV_VAR = 'BOOKS_SCRAPER_CACHE'
+CACHE_FILE_NAME = 'books_cache.sqlite'
+
+# Matches the stock count in text like "In stock (22 available)"
+_AVAIL_RE = re.compile(r'\((\d+) available\)')
+
+
+def _build_session(cache_path: Optional[str] = None) -> requests.Session:
+    """
+    Create the requests session with headers, connection pooling and retries.
+    
+    Args:
+        cache_path: SQLite file for a requests-cache response cache; None for no cache.
+            Only 200 responses are cached (for a day), so a 404 marking the current
+            end of the catalogue is always re-checked.
+    """
+    if cache_path is not None:
+        session = CachedSession(cache_path, backend='sqlite', expire_after=86400,
+                                allowable_codes=(200,))
+    else:
+        session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Connection': 'keep-alive',
+        # gzip/deflate, plus br (and zstd) when brotli (zstandard) is installed to decode them
+        'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding']
+    })
+    
+    # Size the pool for the concurrent detail fetches so sockets stay alive between requests.
+    # Throttling is adaptive: 429/503 responses are retried after their Retry-After header,
+    # otherwise with jittered exponential backoff, instead of sleeping between every page.
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            backoff_jitter=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Sessions built on first use, keyed by cache path, and shared by every BookScraper
+# so all instances (e.g. repeated pipeline runs) reuse one keep-alive connection pool
+_SESSIONS: Dict[Optional[str], requests.Session] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(cache_path: Optional[str] = None) -> requests.Session:
+    """Return the shared session for cache_path, building it on first use."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(cache_path)
+        if session is None:
+            session = _SESSIONS[cache_path] = _build_session(cache_path)
+        return session
 
 
 class BookScraper:
@@ -29,21 +123,65 @@ class BookScraper:
     """
     
     # Class constants
+    HOME_URL = "http://books.toscrape.com/index.html"
     BASE_URL = "http://books.toscrape.com/catalogue/page-{}.html"
     DETAIL_BASE_URL = "http://books.toscrape.com/catalogue/"
+    # Single libxml2 HTML parser shared by every fetch (the site is served as UTF-8)
+    HTML_PARSER = html.HTMLParser(encoding='utf-8')
+    RATING_MAP = {'One': 1, 'Two': 2, 'Three': 3, 'Four': 4, 'Five': 5}
+    
+    # XPath queries compiled once; the book-card queries are relative to an <article>
+    BOOKS_XPATH = etree.XPath("//article[@class='product_pod']")
+    TITLE_XPATH = etree.XPath("h3/a/@title")
+    HREF_XPATH = etree.XPath("h3/a/@href")
+    PRICE_XPATH = etree.XPath(".//p[@class='price_color']/text()")
+    RATING_XPATH = etree.XPath("p[contains(@class, 'star-rating')]/@class")
+    CATEGORY_XPATH = etree.XPath("//ul[@class='breadcrumb']/li[3]/a/text()")
+    AVAILABILITY_XPATH = etree.XPath("string(//p[@class='instock availability'])")
+    CATEGORY_LINKS_XPATH = etree.XPath("//div[@class='side_categories']/ul/li/ul/li/a")
+    NEXT_PAGE_XPATH = etree.XPath("//li[@class='next']/a/@href")
+    LISTING_AVAILABILITY_XPATH = etree.XPath("normalize-space(.//p[contains(@class, 'availability')])")
+    # Number of listing pages requested together before checking for the end of the catalogue
+    LISTING_PAGE_WINDOW = 5
+    CSV_FIELDNAMES = ['title', 'price', 'rating', 'availability', 'category']
+    CSV_BUFFER_SIZE = 1024 * 1024
     
-    def __init__(self, output_file: str = 'data/scraped_books.csv', max_pages: int = 1, logger=None):
+    def __init__(self, output_file: str = 'data/scraped_books.csv', max_pages: int = 1, logger=None,
+                 max_workers: int = 16, fetch_details: bool = True,
+                 use_cache: Optional[bool] = None):
         """
         Initialize the BookScraper.
         
         Args:
-            output_file: Path to the output CSV file
+            output_file: Path to the output CSV file; a '.parquet' path writes Parquet
+                instead (requires pyarrow)
             max_pages: Maximum number of pages to scrape (0 = all pages)
             logger: Optional logger to use instead of creating one
+            max_workers: Number of pages fetched concurrently (at most POOL_MAXSIZE, or
+                surplus connections are closed instead of being reused)
+            fetch_details: Open every book's detail page to read its exact stock count. When False,
+                books are crawled category by category from the listing pages alone, so no
+                per-book requests are made and availability is 1 (in stock) or 0.
+            use_cache: Cache responses for a day in books_cache.sqlite next to output_file
+                (requires requests-cache). None reads the BOOKS_SCRAPER_CACHE environment
+                variable ('1'/'true'/'yes' to enable); caching is off by default.
         """
         self.output_file = output_file
         self.max_pages = max_pages
-        self.session = requests.Session()
+        self.max_workers = max_workers
+        self.fetch_details = fetch_details
+        if use_cache is None:
+            use_cache = os.environ.get(CACHE_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+        self.use_cache = use_cache
+        # Open only while scrape_books runs; rows are streamed to it page by page
+        self._csv_file = None
+        self._writer = None
+        # Parquet output: rows wait here until the next flush writes them as one record batch
+        self._parquet_writer = None
+        self._pending_rows: List[BookRow] = []
+        self._progress = None
+        # Category listing URL -> category name, filled once from the home page sidebar
+        self._category_cache: Dict[str, str] = {}
         if logger:
             self.logger = logger
         else:
@@ -66,19 +204,23 @@ class BookScraper:
         self.logger = logging.getLogger(__name__)
     
     def _setup_session(self) -> None:
-        """Set up the requests session with headers and configuration."""
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        self.logger.info("HTTP session configured with user agent")
+        """Choose the response cache (if any); the shared session itself is built on first use."""
+        self._cache_path = None
+        if self.use_cache:
+            if CachedSession is None:
+                self.logger.warning("Response cache requested but requests-cache is not installed")
+            else:
+                cache_dir = os.path.dirname(os.path.abspath(self.output_file))
+                self._cache_path = os.path.join(cache_dir, CACHE_FILE_NAME)
+                self.logger.info(f"Caching responses for a day in {self._cache_path}")
+        self.logger.info("HTTP session configured with user agent and pooled keep-alive connections")
     
-    def _random_delay(self) -> None:
-        """Apply a random delay between 1-3 seconds."""
-        delay = random.uniform(1, 3)
-        self.logger.debug(f"Applying random delay of {delay:.2f} seconds")
-        time.sleep(delay)
+    @property
+    def session(self) -> requests.Session:
+        """Shared requests session for this scraper's cache setting."""
+        return _get_session(self._cache_path)
     
-    def _fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch_page(self, url: str) -> Optional[html.HtmlElement]:
         """
         Fetch and parse a web page.
         
@@ -86,14 +228,14 @@ class BookScraper:
             url: The URL to fetch
             
         Returns:
-            BeautifulSoup object if successful, None otherwise
+            Parsed HTML document if successful, None otherwise
         """
         self.logger.debug(f"Fetching page: {url}")
         try:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             self.logger.debug(f"Successfully fetched page: {url} (Status: {response.status_code})")
-            return BeautifulSoup(response.content, 'html.parser')
+            return html.document_fromstring(response.content, parser=self.HTML_PARSER)
         except requests.exceptions.HTTPError as e:
             if hasattr(e, 'response') and e.response.status_code == 404:
                 self.logger.info(f"Reached end of pages - Page {url} not found (404)")
@@ -105,7 +247,7 @@ class BookScraper:
             try:
                 response = self.session.get(url, timeout=60)
                 response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                return html.document_fromstring(response.content, parser=self.HTML_PARSER)
             except Exception as retry_e:
                 self.logger.error(f"Retry failed for {url}: {retry_e}")
                 return None
@@ -119,70 +261,53 @@ class BookScraper:
             self.logger.error(f"Unexpected error occurred while fetching {url}: {e}")
             return None
     
-    def _extract_title(self, book_element) -> str:
+    def _parse_book_card(self, book_element: html.HtmlElement) -> Tuple[str, str, str, int]:
         """
-        Extract book title from book element.
+        Extract title, detail link, price and rating from a listing-page book card.
         
         Args:
-            book_element: BeautifulSoup element containing book data
+            book_element: <article class="product_pod"> element of a listing page
             
         Returns:
-            Book title as string
+            Tuple of (title, relative detail URL, price with currency symbol, rating 1-5).
+            Missing fields fall back to "Unknown Title", '', '0.0' and 0.
         """
-        try:
-            title = book_element.h3.a['title']
-            self.logger.debug(f"Extracted title: {title}")
-            return title
-        except (AttributeError, KeyError):
+        titles = self.TITLE_XPATH(book_element)
+        hrefs = self.HREF_XPATH(book_element)
+        prices = self.PRICE_XPATH(book_element)
+        rating_classes = self.RATING_XPATH(book_element)
+        
+        if titles:
+            title = str(titles[0])
+        else:
             self.logger.warning("Failed to extract book title, using default")
-            return "Unknown Title"
-    
-    def _extract_price(self, book_element) -> str:
-        """
-        Extract book price from book element, preserving currency symbol.
+            title = "Unknown Title"
         
-        Args:
-            book_element: BeautifulSoup element containing book data
-            
-        Returns:
-            Price as string with currency symbol, '0.0' if extraction fails
-        """
-        try:
-            price_str = book_element.find('p', class_='price_color').text.strip()
+        href = str(hrefs[0]) if hrefs else ''
+        
+        if prices:
             # Keep the currency symbol and numeric value
-            self.logger.debug(f"Extracted price: {price_str}")
-            return price_str
-        except (AttributeError) as e:
-            self.logger.warning(f"Failed to extract price: {e}")
-            return '0.0'
-    
-    def _extract_rating(self, book_element) -> int:
-        """
-        Extract book rating from book element.
+            price = prices[0].strip()
+        else:
+            self.logger.warning("Failed to extract price, using default value '0.0'")
+            price = '0.0'
         
-        Args:
-            book_element: BeautifulSoup element containing book data
-            
-        Returns:
-            Rating as integer (1-5), 0 if extraction fails
-        """
-        try:
-            rating_map = {'One': 1, 'Two': 2, 'Three': 3, 'Four': 4, 'Five': 5}
-            rating_tag = book_element.find('p', class_=re.compile(r'star-rating'))
-            rating_class = rating_tag['class'][1]  # e.g., 'Three'
-            rating = rating_map.get(rating_class, 0)
-            self.logger.debug(f"Extracted rating: {rating}/5 stars")
-            return rating
-        except (AttributeError, IndexError, TypeError):
+        rating_words = rating_classes[0].split() if rating_classes else []
+        if len(rating_words) > 1:
+            rating = self.RATING_MAP.get(rating_words[1], 0)  # e.g., 'star-rating Three'
+        else:
             self.logger.warning("Failed to extract rating, using default value 0")
-            return 0
+            rating = 0
+        
+        self.logger.debug(f"Extracted book card: {title} | {price} | {rating}/5 stars")
+        return title, href, price, rating
     
-    def _extract_book_details(self, book_element) -> Dict[str, str]:
+    def _extract_book_details(self, book_relative_url: str) -> Dict[str, str]:
         """
         Extract detailed information from book's detail page.
         
         Args:
-            book_element: BeautifulSoup element containing book data
+            book_relative_url: Link to the detail page as found on the listing page
             
         Returns:
             Dictionary containing category and availability
@@ -190,23 +315,23 @@ class BookScraper:
         details = {"category": "Unknown", "availability": 0}
         
         try:
-            book_relative_url = book_element.h3.a['href']
-            book_url = urljoin(self.DETAIL_BASE_URL, book_relative_url.replace('../', ''))
+            # Links are "<slug>/index.html", possibly behind "../" hops; drop those and append
+            book_url = self.DETAIL_BASE_URL + book_relative_url.rpartition('../')[2]
             self.logger.debug(f"Fetching book details from: {book_url}")
-            book_soup = self._fetch_page(book_url)
+            book_page = self._fetch_page(book_url)
             
-            if book_soup is None:
+            if book_page is None:
                 self.logger.warning("Failed to fetch book detail page")
                 return details
             
             # Extract category
-            category = self._extract_category(book_soup)
+            category = self._extract_category(book_page)
             if category:
                 details["category"] = category
                 self.logger.debug(f"Extracted category: {category}")
             
             # Extract availability
-            availability = self._extract_availability(book_soup)
+            availability = self._extract_availability(book_page)
             details["availability"] = availability
             self.logger.debug(f"Extracted availability: {'In Stock' if availability else 'Out of Stock'}")
             
@@ -215,172 +340,356 @@ class BookScraper:
         
         return details
     
-    def _extract_category(self, book_soup: BeautifulSoup) -> Optional[str]:
+    def _extract_category(self, book_page: html.HtmlElement) -> Optional[str]:
         """
         Extract category from book detail page.
         
         Args:
-            book_soup: BeautifulSoup object of book detail page
+            book_page: Parsed HTML of book detail page
             
         Returns:
             Category name or None if not found
         """
-        try:
-            breadcrumb = book_soup.find('ul', class_='breadcrumb')
-            if breadcrumb and len(breadcrumb.find_all('li')) > 2:
-                return breadcrumb.find_all('li')[2].a.text.strip()
-        except (AttributeError, IndexError):
-            pass
-        return None
+        # Breadcrumb is Home > Books > <category> > <title>
+        category = self.CATEGORY_XPATH(book_page)
+        return category[0].strip() if category else None
     
-    def _extract_availability(self, book_soup: BeautifulSoup) -> int:
+    def _extract_availability(self, book_page: html.HtmlElement) -> int:
         """
         Extract availability count from book detail page.
         
         Args:
-            book_soup: BeautifulSoup object of book detail page
+            book_page: Parsed HTML of book detail page
             
         Returns:
             Number of items available in stock, 0 if out of stock
         """
-        try:
-            availability_tag = book_soup.find('p', class_='instock availability')
-            if availability_tag:
-                availability_text = availability_tag.text.strip()
-                # Extract number from text like "In stock (22 available)"
-                import re
-                match = re.search(r'\((\d+) available\)', availability_text)
-                if match:
-                    return int(match.group(1))
-                elif 'In stock' in availability_text:
-                    # If no specific count is found but it's in stock, return 1
-                    return 1
-        except (AttributeError, ValueError):
-            pass
+        # Empty string when the tag is missing; no strip needed before the search
+        availability_text = self.AVAILABILITY_XPATH(book_page)
+        match = _AVAIL_RE.search(availability_text)
+        if match:
+            return int(match.group(1))
+        elif 'In stock' in availability_text:
+            # If no specific count is found but it's in stock, return 1
+            return 1
         return 0
     
-    def _extract_book_data(self, book_element) -> Dict[str, any]:
+    def _extract_listing_availability(self, book_element) -> int:
+        """
+        Extract stock status from a book card on a listing page.
+        
+        Args:
+            book_element: <article class="product_pod"> element of a listing page
+            
+        Returns:
+            1 if the book is in stock, 0 otherwise
+        """
+        return 1 if 'In stock' in self.LISTING_AVAILABILITY_XPATH(book_element) else 0
+    
+    def _extract_book_data(self, book_element, category: Optional[str] = None) -> BookRow:
         """
         Extract all data for a single book.
         
         Args:
-            book_element: BeautifulSoup element containing book data
+            book_element: <article class="product_pod"> element of a listing page
+            category: Category of the listing page the book was found on. When given,
+                the detail page is not fetched and availability comes from the listing.
             
         Returns:
-            Dictionary containing all book information
+            Book row ordered like CSV_FIELDNAMES
         """
         self.logger.debug("Starting book data extraction")
-        title = self._extract_title(book_element)
-        price = self._extract_price(book_element)
-        rating = self._extract_rating(book_element)
-        details = self._extract_book_details(book_element)
-        
-        book_data = {
-            'title': title,
-            'price': price,
-            'rating': rating,
-            'availability': details['availability'],
-            'category': details['category']
-        }
+        title, href, price, rating = self._parse_book_card(book_element)
+        if category is None:
+            details = self._extract_book_details(href)
+        else:
+            details = {"category": category, "availability": self._extract_listing_availability(book_element)}
         
         self.logger.info(f"Successfully extracted: '{title}'")
-        return book_data
+        return title, price, rating, details['availability'], details['category']
     
-    def _save_to_csv(self, books_data: List[Dict[str, any]]) -> None:
+    def _write_rows(self, books_data: List[BookRow]) -> None:
         """
-        Save book data to CSV file.
+        Append one listing page's book rows to the open CSV file (or the
+        pending Parquet batch) and advance the page progress bar.
         
         Args:
-            books_data: List of dictionaries containing book information
+            books_data: List of book rows ordered like CSV_FIELDNAMES
         """
-        self.logger.info(f"Saving {len(books_data)} books to CSV file: {self.output_file}")
+        if self._parquet_writer is not None:
+            self._pending_rows.extend(books_data)
+        else:
+            self._writer.writerows(books_data)
+        # One progress update per page keeps terminal writes off the per-book path
+        self._progress.update(1)
+        self.logger.debug(f"Wrote {len(books_data)} books to {self.output_file}")
+    
+    def _flush_rows(self) -> None:
+        """
+        Hand written rows to the OS so a crash keeps them.
         
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
-        self.logger.debug(f"Created output directory: {os.path.dirname(self.output_file)}")
+        For Parquet output the pending rows are written as one record batch
+        (one row group), so memory stays bounded by a batch of listing pages.
+        """
+        if self._csv_file is not None:
+            self._csv_file.flush()
+        elif self._parquet_writer is not None and self._pending_rows:
+            columns = zip(*self._pending_rows)
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(columns, _PARQUET_SCHEMA)],
+                schema=_PARQUET_SCHEMA
+            )
+            self._parquet_writer.write_batch(batch)
+            self._pending_rows = []
+    
+    def _submit_listing_page(self, page_num: int, page: html.HtmlElement,
+                             executor: ThreadPoolExecutor) -> Optional[List[Future]]:
+        """
+        Queue data extraction for every book on an already fetched listing page.
         
-        fieldnames = ['title', 'price', 'rating', 'availability', 'category']
+        Args:
+            page_num: Number of the listing page
+            page: Parsed HTML of the listing page
+            executor: Thread pool used to fetch the book detail pages
+            
+        Returns:
+            One future per book resolving to its book row, or None if the page contains no books
+        """
+        books = self.BOOKS_XPATH(page)
+        if not books:
+            self.logger.info(f"No books found on page {page_num}. Reached end of content.")
+            return None
         
-        try:
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(books_data)
-            self.logger.info(f"Successfully saved {len(books_data)} books to {self.output_file}")
-        except Exception as e:
-            self.logger.error(f"Failed to save data to CSV: {e}")
-            raise
+        self.logger.info(f"Found {len(books)} books on page {page_num}")
+        
+        # Detail-page requests are I/O bound, so overlap them across worker threads
+        return [executor.submit(self._extract_book_data, book) for book in books]
     
-    def scrape_books(self) -> None:
+    def _collect_listing_page(self, page_num: int, futures: List[Future]) -> List[BookRow]:
         """
-        Main method to scrape all books from the website.
+        Wait for the book rows queued by _submit_listing_page, in listing order.
         
-        This method iterates through all pages, extracts book data,
-        and saves it to a CSV file.
+        Args:
+            page_num: Number of the listing page
+            futures: Futures returned by _submit_listing_page
+            
+        Returns:
+            List of successfully extracted book rows
         """
-        self.logger.info("Starting book scraping process")
-        all_books = []
+        page_books = []
+        for book_num, future in enumerate(futures, 1):
+            try:
+                page_books.append(future.result())
+            except Exception as e:
+                self.logger.error(f"Failed to process book {book_num} on page {page_num}: {e}")
+                continue
+        
+        self.logger.info(f"Completed page {page_num}, successfully processed {len(page_books)}/{len(futures)} books")
+        return page_books
+    
+    def _discover_categories(self) -> Dict[str, str]:
+        """
+        Read the category listing URLs from the home page sidebar.
+        
+        The sidebar is only fetched and parsed on the first call; later
+        scrapes with the same scraper reuse the cached mapping.
+        
+        Returns:
+            Dictionary mapping category listing URL to category name
+        """
+        if self._category_cache:
+            return self._category_cache
+        
+        page = self._fetch_page(self.HOME_URL)
+        if page is None:
+            return {}
+        
+        categories = {}
+        for link in self.CATEGORY_LINKS_XPATH(page):
+            categories[urljoin(self.HOME_URL, link.get('href'))] = link.text_content().strip()
+        self.logger.info(f"Discovered {len(categories)} categories")
+        self._category_cache = categories
+        return categories
+    
+    def _scrape_catalogue(self, executor: ThreadPoolExecutor) -> Tuple[int, int]:
+        """
+        Scrape the main catalogue, opening every book's detail page.
+        
+        Each listing page's books are written to the CSV as soon as the page is done.
+        
+        Args:
+            executor: Thread pool used for listing-page windows and detail-page fan-out
+            
+        Returns:
+            Tuple of (number of books written, number of listing pages scraped)
+        """
+        books_written = 0
         page_num = 1
         limited_pages = self.max_pages  # Use the max_pages parameter
-        books_processed = 0
+        pages_scraped = 0
+        reached_end = False
 
-        while limited_pages == 0 or page_num <= limited_pages:
+        while not reached_end and (limited_pages == 0 or page_num <= limited_pages):
+            window_end = page_num + self.LISTING_PAGE_WINDOW
+            if limited_pages:
+                window_end = min(window_end, limited_pages + 1)
+            page_nums = range(page_num, window_end)
+        
             try:
-                url = self.BASE_URL.format(page_num)
-                self.logger.info(f"Scraping page {page_num}: {url}")
-                
-                soup = self._fetch_page(url)
-                if soup is None:
-                    self.logger.info(f"No more pages available. Stopped at page {page_num}")
-                    break
-                
-                books = soup.find_all('article', class_='product_pod')
-                if not books:
-                    self.logger.info(f"No books found on page {page_num}. Reached end of content.")
-                    break
-                
-                self.logger.info(f"Found {len(books)} books on page {page_num}")
-                
-                page_books_processed = 0
-                for book in tqdm(books, desc=f"Processing books on page {page_num}", unit="book"):
-                    try:
-                        book_data = self._extract_book_data(book)
-                        all_books.append(book_data)
-                        books_processed += 1
-                        page_books_processed += 1
-                        # Removed debug log to avoid cluttering with tqdm
-                    except Exception as e:
-                        self.logger.error(f"Failed to process book {books_processed + 1} on page {page_num}: {e}")
-                        continue
-                
-                self.logger.info(f"Completed page {page_num}, successfully processed {page_books_processed}/{len(books)} books")
+                # Listing pages are independent, so fetch the whole window at once
+                urls = [self.BASE_URL.format(num) for num in page_nums]
+                pages = list(executor.map(self._fetch_page, urls))
+            
+                submitted = []
+                for num, url, page in zip(page_nums, urls, pages):
+                    self.logger.info(f"Scraping page {num}: {url}")
+                    if page is None:
+                        self.logger.info(f"No more pages available. Stopped at page {num}")
+                        reached_end = True
+                        break
                 
-                # Add random delay between page requests (but not after the last page)
-                if limited_pages == 0 or page_num < limited_pages:
-                    self._random_delay()
+                    futures = self._submit_listing_page(num, page, executor)
+                    if futures is None:
+                        reached_end = True
+                        break
+                    submitted.append((num, futures))
                 
+                # Every detail request in the window is queued before any is awaited,
+                # so the pool stays busy across page boundaries
+                for num, futures in submitted:
+                    page_books = self._collect_listing_page(num, futures)
+                    self._write_rows(page_books)
+                    books_written += len(page_books)
+                    pages_scraped += 1
+                # Hand the window's rows to the OS in one write
+                self._flush_rows()
+            
             except KeyboardInterrupt:
                 self.logger.warning(f"Scraping interrupted by user at page {page_num}")
                 break
             except Exception as e:
-                self.logger.error(f"Unexpected error on page {page_num}: {e}")
-                self.logger.info("Attempting to continue with next page...")
+                self.logger.error(f"Unexpected error on pages {page_nums[0]}-{page_nums[-1]}: {e}")
+                self.logger.info("Attempting to continue with next pages...")
+            
+            page_num = window_end
+        
+        return books_written, pages_scraped
+    
+    def _scrape_categories(self, executor: ThreadPoolExecutor) -> Tuple[int, int]:
+        """
+        Scrape books category by category from the listing pages only.
+        
+        Every category's current listing page is fetched concurrently; the
+        category name is known from the listing, so no detail pages are opened.
+        Each page's books are written to the CSV as soon as the page is parsed.
+        
+        Args:
+            executor: Thread pool used to fetch the listing pages
+            
+        Returns:
+            Tuple of (number of books written, number of listing pages scraped)
+        """
+        books_written = 0
+        pages_scraped = 0
+        pending = list(self._discover_categories().items())
+        
+        try:
+            while pending and (self.max_pages == 0 or pages_scraped < self.max_pages):
+                if self.max_pages:
+                    pending = pending[:self.max_pages - pages_scraped]
+                pages = list(executor.map(self._fetch_page, [url for url, _ in pending]))
                 
-            page_num += 1
+                next_pending = []
+                for (url, category), page in zip(pending, pages):
+                    if page is None:
+                        continue
+                    self.logger.info(f"Scraping {category} page: {url}")
+                    page_books = []
+                    for book in self.BOOKS_XPATH(page):
+                        try:
+                            page_books.append(self._extract_book_data(book, category))
+                        except Exception as e:
+                            self.logger.error(f"Failed to process book on {url}: {e}")
+                    self._write_rows(page_books)
+                    books_written += len(page_books)
+                    pages_scraped += 1
+                    
+                    next_href = self.NEXT_PAGE_XPATH(page)
+                    if next_href:
+                        next_pending.append((urljoin(url, next_href[0]), category))
+                pending = next_pending
+                # Hand this round's rows to the OS in one write
+                self._flush_rows()
+        except KeyboardInterrupt:
+            self.logger.warning(f"Scraping interrupted by user after {pages_scraped} pages")
+        
+        return books_written, pages_scraped
+    
+    def _run_crawl(self) -> Tuple[int, int]:
+        """
+        Run the configured crawl with a progress bar and a shared thread pool.
+        
+        Returns:
+            Tuple of (number of books written, number of listing pages scraped)
+        """
+        # One pool serves both the listing pages and the detail-page fan-out.
+        # The bar counts listing pages; the page cap gives it a percentage and ETA.
+        with tqdm(desc="Scraping pages", unit="page", total=self.max_pages or None) as self._progress, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            if self.fetch_details:
+                return self._scrape_catalogue(executor)
+            return self._scrape_categories(executor)
+    
+    def scrape_books(self) -> None:
+        """
+        Main method to scrape all books from the website.
+        
+        This method fetches listing pages concurrently, extracts book data,
+        and streams it to a CSV file page by page, so memory use stays flat
+        and rows scraped before a failure are kept. A '.parquet' output file
+        is streamed the same way, one record batch per flush.
+        """
+        self.logger.info("Starting book scraping process")
+        
+        # Create directory if it doesn't exist
+        os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
         
-        # Save the data to CSV file
         try:
-            if all_books:
-                self._save_to_csv(all_books)
-                self.logger.info(f"Scraping complete! Total books processed: {len(all_books)} from {page_num - 1} pages")
-                print(f"Scraping complete! {len(all_books)} books saved to {self.output_file}")
+            if self.output_file.endswith('.parquet'):
+                if pa is None:
+                    raise ImportError("pyarrow is required to write Parquet output")
+                self.logger.info(f"Streaming books to Parquet file: {self.output_file}")
+                with pq.ParquetWriter(self.output_file, _PARQUET_SCHEMA,
+                                      compression='zstd') as self._parquet_writer:
+                    books_written, pages_scraped = self._run_crawl()
+                    # Rows collected before an interruption have not been flushed yet
+                    self._flush_rows()
             else:
-                self.logger.warning("No books were scraped successfully")
-                print("Warning: No books were scraped. Please check the website or your connection.")
+                self.logger.info(f"Streaming books to CSV file: {self.output_file}")
+                # Large buffer: rows are flushed once per batch of listing pages, not per page
+                with open(self.output_file, 'w', newline='', encoding='utf-8',
+                          buffering=self.CSV_BUFFER_SIZE) as self._csv_file:
+                    # Rows are plain tuples in CSV_FIELDNAMES order, so no per-field dict lookups
+                    self._writer = csv.writer(self._csv_file)
+                    self._writer.writerow(self.CSV_FIELDNAMES)
+                    books_written, pages_scraped = self._run_crawl()
         except Exception as e:
             self.logger.error(f"Failed to save scraped data: {e}")
             print(f"Error: Failed to save data - {e}")
             raise
+        finally:
+            self._csv_file = None
+            self._writer = None
+            self._parquet_writer = None
+            self._pending_rows = []
+            self._progress = None
+        
+        if books_written:
+            self.logger.info(f"Scraping complete! Total books processed: {books_written} from {pages_scraped} pages")
+            print(f"Scraping complete! {books_written} books saved to {self.output_file}")
+        else:
+            self.logger.warning("No books were scraped successfully")
+            print("Warning: No books were scraped. Please check the website or your connection.")
 
 
 def main() -> None:
@@ -5,14 +5,62 @@ This module provides a robust data cleaning system following OOP principles
 and PEP standards for handling messy real-world data.
 """
 
+import functools
 import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    # Optional: multithreaded C++ CSV reader and Arrow IPC writer, used when installed
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+except ImportError:
+    pa = None
+
+# Arrow IPC (Feather v2) files: binary, typed hand-off between pipeline steps
+_ARROW_SUFFIXES = ('.arrow', '.feather')
+
+# Text patterns compiled once at import instead of looked up in re's cache per call
+_NONALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+_HASHTAG_RE = re.compile(r'#\w+')
+_MENTION_RE = re.compile(r'@\w+')
+# ASCII bytes _NONALNUM_RE would remove: everything but a-z, 0-9 and whitespace
+_ASCII_NONALNUM = bytes(b for b in range(128)
+                        if not (chr(b).isdigit() or 'a' <= chr(b) <= 'z' or chr(b).isspace()))
+# Whitespace-separated words of at least 3 characters (extract_keywords' default)
+_KEYWORD_RE = re.compile(r'\S{3,}')
+
+
+def _clean_text(text: Any) -> str:
+    """Lowercase text, drop non-alphanumerics and collapse whitespace (see DataCleaner.clean_text)."""
+    if not isinstance(text, str):
+        return ''
+    return _clean_str(text)
+
+
+# Pure function over a few dozen categories and repeated titles, so memoize it
+@functools.lru_cache(maxsize=65536)
+def _clean_str(text: str) -> str:
+    """Clean a single string (the memoized body of _clean_text)."""
+    text = text.lower().strip()
+    
+    if text.isascii():
+        # Fast path: most titles are already plain words separated by single spaces
+        if text.replace(' ', '').isalnum() and '  ' not in text:
+            return text
+        # bytes.translate deletes characters in one C loop, without the regex engine
+        text = text.encode('ascii').translate(None, _ASCII_NONALNUM).decode('ascii')
+    else:
+        text = _NONALNUM_RE.sub('', text)
+    
+    return _WS_RE.sub(' ', text)
+
 
 class DataCleaner:
     """
@@ -41,10 +89,11 @@ class DataCleaner:
     
     def load_data(self, file_path: str) -> pd.DataFrame:
         """
-        Load data from a CSV file with error handling.
+        Load data from a CSV (or Parquet/Arrow) file with error handling.
         
         Args:
-            file_path: Path to the input CSV file
+            file_path: Path to the input CSV file; '.parquet', '.arrow' and '.feather'
+                files are read with pyarrow
             
         Returns:
             Loaded DataFrame
@@ -54,7 +103,22 @@ class DataCleaner:
             pd.errors.EmptyDataError: If the file is empty
         """
         try:
-            df = pd.read_csv(file_path)
+            if str(file_path).endswith('.parquet'):
+                # Columnar scraper output keeps its dtypes (int8 rating, categorical category)
+                df = pd.read_parquet(file_path)
+            elif str(file_path).endswith(_ARROW_SUFFIXES):
+                df = pd.read_feather(file_path)
+            elif pa is not None:
+                # The pyarrow engine reports an empty file as a generic ParserError
+                if os.path.getsize(file_path) == 0:
+                    raise pd.errors.EmptyDataError(file_path)
+                df = pd.read_csv(file_path, engine='pyarrow')
+                # Arrow-backed strings keep text in contiguous UTF-8 buffers instead of
+                # one Python object per cell, and .str methods run as Arrow kernels
+                for col in df.select_dtypes(include=['object']).columns:
+                    df[col] = df[col].astype('string[pyarrow]')
+            else:
+                df = pd.read_csv(file_path)
             print(f"Successfully loaded data. Initial shape: {df.shape}")
             self.processing_stats['initial_rows'] = len(df)
             return df
@@ -91,25 +155,21 @@ class DataCleaner:
         Handle missing values in the DataFrame.
         
         Args:
-            df: Input DataFrame
+            df: Input DataFrame; its columns are updated in place
             
         Returns:
             DataFrame with missing values handled
         """
         print("Handling missing values...")
-        df_cleaned = df.copy()
+        df_cleaned = df
         
-        # Fill numerical columns
+        # Fill numerical and categorical columns in a single fillna call
         numerical_cols = df_cleaned.select_dtypes(include=['float64', 'int64']).columns
-        for col in numerical_cols:
-            if col in df_cleaned.columns:
-                df_cleaned[col] = df_cleaned[col].fillna(self.numerical_fill_value)
-        
-        # Fill categorical columns
-        categorical_cols = df_cleaned.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
-            if col in df_cleaned.columns and col not in self.required_columns:
-                df_cleaned[col] = df_cleaned[col].fillna(self.categorical_fill_value)
+        categorical_cols = df_cleaned.select_dtypes(include=['object', 'string']).columns
+        fill_values = {col: self.numerical_fill_value for col in numerical_cols}
+        fill_values.update({col: self.categorical_fill_value for col in categorical_cols
+                            if col not in self.required_columns})
+        df_cleaned = df_cleaned.fillna(fill_values)
         
         # Drop rows with missing required columns
         initial_rows = len(df_cleaned)
@@ -131,19 +191,9 @@ class DataCleaner:
         Returns:
             Cleaned text string
         """
-        if not isinstance(text, str):
-            return ''
-        
-        # Convert to lowercase and strip whitespace
-        text = text.lower().strip()
-        
-        # Remove special characters, keep alphanumeric and spaces
-        text = re.sub(r'[^a-z0-9\s]', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text
+        # Lowercase and strip, remove special characters (keep alphanumerics
+        # and spaces), then collapse extra whitespace
+        return _clean_text(text)
     
     def extract_hashtags(self, text: str) -> List[str]:
         """
@@ -158,7 +208,7 @@ class DataCleaner:
         if not isinstance(text, str):
             return []
         
-        hashtags = re.findall(r'#\w+', text)
+        hashtags = _HASHTAG_RE.findall(text)
         return [tag.lower() for tag in hashtags]
     
     def extract_mentions(self, text: str) -> List[str]:
@@ -174,7 +224,7 @@ class DataCleaner:
         if not isinstance(text, str):
             return []
         
-        mentions = re.findall(r'@\w+', text)
+        mentions = _MENTION_RE.findall(text)
         return [mention.lower() for mention in mentions]
     
     def extract_keywords(self, text: str, min_length: int = 3) -> List[str]:
@@ -197,19 +247,59 @@ class DataCleaner:
         
         return keywords
     
+    def _clean_text_column(self, series: pd.Series) -> pd.Series:
+        """
+        Apply clean_text to a whole column.
+        
+        A single map of the fast-path cleaner beats chained Series.str calls,
+        which each loop over the column in Python for object data anyway.
+        
+        Args:
+            series: Column to clean
+            
+        Returns:
+            Cleaned column; non-string values become ''
+        """
+        return series.map(_clean_text)
+    
+    def _extract_text_features(self, series: pd.Series) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """
+        Extract hashtags, mentions and up to 5 keywords for a whole column.
+        
+        Equivalent to extract_hashtags, extract_mentions and extract_keywords
+        with each list joined into a comma-separated string, but computed in a
+        single pass over the column.
+        
+        Args:
+            series: Original (uncleaned) text column
+            
+        Returns:
+            Tuple of (hashtags, mentions, keywords) string columns
+        """
+        def features(text: Any) -> Tuple[str, str, str]:
+            if not isinstance(text, str):
+                return '', '', ''
+            return (','.join(_HASHTAG_RE.findall(text)).lower(),
+                    ','.join(_MENTION_RE.findall(text)).lower(),
+                    ','.join(_KEYWORD_RE.findall(text.lower())[:5]))
+        
+        extracted = pd.DataFrame(series.map(features).tolist(), index=series.index,
+                                 columns=['hashtags', 'mentions', 'keywords'])
+        return extracted['hashtags'], extracted['mentions'], extracted['keywords']
+    
     def standardize_datetime(self, df: pd.DataFrame, 
                            datetime_columns: List[str]) -> pd.DataFrame:
         """
         Standardize datetime columns to a consistent format.
         
         Args:
-            df: Input DataFrame
+            df: Input DataFrame; its columns are updated in place
             datetime_columns: List of column names containing datetime data
             
         Returns:
             DataFrame with standardized datetime columns
         """
-        df_cleaned = df.copy()
+        df_cleaned = df
         
         for col in datetime_columns:
             if col in df_cleaned.columns:
@@ -221,6 +311,40 @@ class DataCleaner:
         
         return df_cleaned
     
+    def optimize_dtypes(self, df: pd.DataFrame,
+                        integer_columns: Optional[List[str]] = None,
+                        category_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Shrink column dtypes once cleaning is finished.
+        
+        Whole-number columns are downcast to the smallest integer type that
+        holds them, and low-cardinality text columns become categoricals, so
+        the cleaned frame takes less memory and groups on integer codes.
+        
+        Args:
+            df: Input DataFrame; its columns are updated in place
+            integer_columns: Columns to downcast when all values are whole numbers
+            category_columns: Columns to store as pandas categoricals
+            
+        Returns:
+            DataFrame with optimized dtypes
+        """
+        integer_columns = integer_columns or ['rating', 'availability']
+        category_columns = category_columns or ['category']
+        
+        for col in integer_columns:
+            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+                downcast = pd.to_numeric(df[col], downcast='integer')
+                # Columns with NaN or fractional values stay floating point
+                if pd.api.types.is_integer_dtype(downcast):
+                    df[col] = downcast
+        
+        for col in category_columns:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        return df
+    
     def validate_data(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Perform data validation and quality checks.
@@ -241,7 +365,7 @@ class DataCleaner:
         }
         
         # Check for empty strings in text columns
-        text_columns = df.select_dtypes(include=['object']).columns
+        text_columns = df.select_dtypes(include=['object', 'string', 'category']).columns
         empty_strings = {}
         for col in text_columns:
             empty_count = (df[col] == '').sum()
@@ -259,7 +383,7 @@ class DataCleaner:
         If no currency symbol, assumes USD.
         
         Args:
-            df: Input DataFrame
+            df: Input DataFrame; its columns are updated in place
             
         Returns:
             DataFrame with prices converted to USD
@@ -268,8 +392,6 @@ class DataCleaner:
             print("Warning: No 'price' column found for currency conversion")
             return df
         
-        df = df.copy()
-        
         # Define conversion rates (as of September 2025)
         rates = {
             '£': 1.27,  # GBP to USD
@@ -277,38 +399,42 @@ class DataCleaner:
             '$': 1.0    # USD to USD (no conversion needed)
         }
         
-        converted_count = 0
+        prices = df['price']
+        present = prices.notna().to_numpy()
+        price_str = prices[present].astype(str).str.strip()
         
-        def convert_price(price):
-            nonlocal converted_count
-            if pd.isna(price):
-                return price
-            
-            # Convert to string to check for currency symbols
-            price_str = str(price).strip()
-            
-            for symbol, rate in rates.items():
-                if price_str.startswith(symbol):
-                    # Remove symbol and convert
-                    numeric_part = price_str[len(symbol):].strip()
-                    try:
-                        numeric_value = float(numeric_part)
-                        converted_value = numeric_value * rate
-                        converted_count += 1
-                        return round(converted_value, 2)
-                    except ValueError:
-                        print(f"Warning: Could not convert price '{price_str}'")
-                        return price
-            
-            # No currency symbol found, assume USD
+        # Split off a leading currency symbol; anything without one is USD already
+        symbols = price_str.str[:1]
+        has_symbol = symbols.isin(list(rates)).to_numpy()
+        numeric_part = price_str.where(~has_symbol, price_str.str[1:].str.strip())
+        values = pd.to_numeric(numeric_part, errors='coerce').to_numpy(dtype=float)
+        
+        # Re-check the few values to_numeric rejected with float() (e.g. 'inf'),
+        # warning about those that really are unparseable
+        failed = np.zeros(len(values), dtype=bool)
+        for pos in np.flatnonzero(np.isnan(values)):
             try:
-                return float(price_str)
+                values[pos] = float(numeric_part.iat[pos])
             except ValueError:
-                print(f"Warning: Could not parse price '{price_str}'")
-                return price
-        
-        # Apply conversion
-        df['price'] = df['price'].apply(convert_price)
+                failed[pos] = True
+                if has_symbol[pos]:
+                    print(f"Warning: Could not convert price '{price_str.iat[pos]}'")
+                else:
+                    print(f"Warning: Could not parse price '{price_str.iat[pos]}'")
+        
+        convert = has_symbol & ~failed
+        rate_values = symbols[convert].map(rates).to_numpy(dtype=float)
+        values[convert] = np.round(values[convert] * rate_values, 2)
+        converted_count = int(convert.sum())
+        
+        converted = np.full(len(df), np.nan)
+        converted[present] = values
+        if failed.any():
+            # Unparseable prices are kept as they were
+            converted = converted.astype(object)
+            present_pos = np.flatnonzero(present)[failed]
+            converted[present_pos] = prices.to_numpy()[present_pos]
+        df['price'] = converted
         
         print(f"Converted {converted_count} prices to USD")
         print(f"Assumed {len(df) - converted_count} prices were already in USD")
@@ -327,33 +453,30 @@ class DataCleaner:
         Apply text preprocessing to specified columns.
         
         Args:
-            df: Input DataFrame
+            df: Input DataFrame; its columns are updated in place
             text_columns: List of column names to preprocess
             
         Returns:
             DataFrame with preprocessed text columns
         """
-        df_cleaned = df.copy()
+        df_cleaned = df
         
         print("Applying text preprocessing...")
         for col in text_columns:
             if col in df_cleaned.columns:
                 # Store original for feature extraction
-                original_col = df_cleaned[col].copy()
+                original_col = df_cleaned[col]
                 
                 # Clean the text
-                df_cleaned[col] = df_cleaned[col].apply(self.clean_text)
+                df_cleaned[col] = self._clean_text_column(original_col)
                 
                 # Extract features for social media analysis (using original text)
                 if 'title' in col.lower() or 'text' in col.lower():
-                    # Convert lists to strings for CSV storage
-                    hashtags = original_col.apply(self.extract_hashtags)
-                    mentions = original_col.apply(self.extract_mentions)
-                    keywords = original_col.apply(self.extract_keywords)
-                    
-                    df_cleaned[f'{col}_hashtags'] = hashtags.apply(lambda x: ','.join(x) if x else '')
-                    df_cleaned[f'{col}_mentions'] = mentions.apply(lambda x: ','.join(x) if x else '')
-                    df_cleaned[f'{col}_keywords'] = keywords.apply(lambda x: ','.join(x[:5]) if x else '')  # Limit to 5 keywords
+                    # Lists are stored as comma-separated strings for CSV storage
+                    hashtags, mentions, keywords = self._extract_text_features(original_col)
+                    df_cleaned[f'{col}_hashtags'] = hashtags
+                    df_cleaned[f'{col}_mentions'] = mentions
+                    df_cleaned[f'{col}_keywords'] = keywords
         
         # Remove rows with empty text in required columns
         for col in text_columns:
@@ -368,7 +491,8 @@ class DataCleaner:
         
         Args:
             df: DataFrame to save
-            output_path: Path for the output file
+            output_path: Path for the output file; '.arrow'/'.feather' paths are
+                written as lz4-compressed Arrow IPC instead of CSV
         """
         try:
             # Convert to absolute path
@@ -381,7 +505,10 @@ class DataCleaner:
             print(f"Saving to absolute path: {abs_output_path}")
             print(f"Directory exists: {output_dir.exists()}")
             
-            df.to_csv(abs_output_path, index=False)
+            if abs_output_path.suffix in _ARROW_SUFFIXES:
+                self._write_feather(df, abs_output_path)
+            else:
+                df.to_csv(abs_output_path, index=False)
             
             # Verify file was created
             if abs_output_path.exists():
@@ -398,7 +525,33 @@ class DataCleaner:
             import traceback
             traceback.print_exc()
     
-    def process_pipeline(self, input_path: str, output_path: str,
+    def _write_feather(self, df: pd.DataFrame, output_path: Path) -> None:
+        """
+        Write a DataFrame to an Arrow IPC (Feather v2) file, keeping its dtypes.
+        
+        Args:
+            df: DataFrame to save
+            output_path: Path for the output file
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ImportError("pyarrow is required to write Arrow/Feather output")
+        # Readers get plain text columns, as from a CSV; numeric dtypes are kept
+        categorical = df.select_dtypes(include=['category']).columns
+        if len(categorical):
+            df = df.astype({col: object for col in categorical})
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type columns are stored as text, as a CSV round trip would leave them
+            mixed = df.select_dtypes(include=['object']).columns
+            table = pa.Table.from_pandas(df.astype({col: 'string' for col in mixed}),
+                                         preserve_index=False)
+        pa_feather.write_feather(table, str(output_path), compression='lz4')
+    
+    def process_pipeline(self, input_path: str, output_path: Optional[str],
                         text_columns: Optional[List[str]] = None,
                         datetime_columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
@@ -406,7 +559,7 @@ class DataCleaner:
         
         Args:
             input_path: Path to input CSV file
-            output_path: Path for output CSV file
+            output_path: Path for output CSV file; None keeps the result in memory only
             text_columns: Columns to apply text preprocessing
             datetime_columns: Columns to standardize datetime format
             
@@ -429,6 +582,8 @@ class DataCleaner:
         if datetime_columns:
             df = self.standardize_datetime(df, datetime_columns)
         
+        df = self.optimize_dtypes(df)
+        
         # Validate final data
         validation_results = self.validate_data(df)
         print("\nData validation results:")
@@ -436,7 +591,10 @@ class DataCleaner:
         print(f"Missing values: {sum(validation_results['missing_values'].values())}")
         
         # Save cleaned data
-        self.save_data(df, output_path)
+        if output_path is not None:
+            self.save_data(df, output_path)
+        else:
+            self.processing_stats['final_rows'] = len(df)
         
         # Print processing summary
         self._print_processing_summary()
@@ -11,16 +11,23 @@ Author: GitHub Copilot
 Date: September 2025
 """
 
+import atexit
+import importlib.util
 import os
 import sys
 import time
 import logging
+import queue
 import shutil
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
-from colorama import init, Fore, Back, Style
+# Cleaned data is handed between steps as Arrow IPC (no CSV re-parsing) when available
+ARROW_HANDOFF = importlib.util.find_spec('pyarrow') is not None
 
 # Add subdirectories to path for imports
 current_dir = Path(__file__).parent
@@ -30,19 +37,84 @@ sys.path.append(str(current_dir / 'analysis'))
 sys.path.append(str(current_dir / 'visualizations'))
 sys.path.append(str(current_dir / 'Predictive Analysis'))
 
-# Import pipeline components
-from scraper import BookScraper
-from cleaner import DataCleaner
-from analyzer import BookDataAnalyzer
-from visualizer import BookDataVisualizer
+# Pipeline components (and the pandas/matplotlib/scipy stacks behind them) are
+# imported inside the step that uses them, so single-step runs only load what they need
 
-# Import predictive analysis module
-try:
-    sys.path.append(str(current_dir / 'Predictive Analysis'))
-    from final_predictor import BookPricePredictionSystem
-except ImportError as e:
-    print(f"Warning: Could not import predictive analysis module: {e}")
-    print("Predictive analysis step will be skipped if this import fails.")
+# Listener writing the queued log records to the log file; shared by all
+# AnalysisPipeline instances, since they all log through the same named logger
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Drain and stop the log file listener, closing its file handler."""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    for handler in _log_listener.handlers:
+        handler.close()
+    _log_listener = None
+
+
+# stop() drains the queue, for --step runs as well as full pipeline runs
+atexit.register(_stop_log_listener)
+
+
+def _log_to_file_directly(log_file: str) -> None:
+    """
+    Swap the pipeline logger's queue handler for a plain file handler.
+    
+    Initializer for the render worker process: the parent's queue listener
+    does not run there, so queued records would never reach the log file.
+    
+    Args:
+        log_file: Path to the pipeline log file
+    """
+    logger = logging.getLogger('AnalysisPipeline')
+    for handler in logger.handlers[:]:
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    file_handler = logging.FileHandler(log_file, delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logger.addHandler(file_handler)
+
+
+def _render_visualizations(cleaned_file: str, visualization_dir: str, df: Optional[Any] = None) -> None:
+    """
+    Render every pipeline figure from the cleaned data.
+    
+    Kept at module level so run_full_pipeline can run it in a separate process.
+    
+    Args:
+        cleaned_file: Path to the cleaned data file (CSV or Arrow)
+        visualization_dir: Directory the figures are written to
+        df: Cleaned DataFrame already in memory; cleaned_file is read when None
+    """
+    from visualizer import BookDataVisualizer
+    
+    logger = logging.getLogger('AnalysisPipeline')
+    visualizer = BookDataVisualizer(data_path=cleaned_file, output_dir=visualization_dir, df=df)
+    
+    # The plotly dashboard does not touch pyplot, so it is built on a worker
+    # thread while the matplotlib figures (which share pyplot's global state)
+    # are rendered one after another here
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        logger.info("Generating comprehensive dashboard...")
+        dashboard = executor.submit(visualizer.create_interactive_plotly_dashboard)
+        
+        logger.info("Generating price distribution plots...")
+        visualizer.create_price_distribution_plots()
+        
+        logger.info("Generating rating analysis plots...")
+        visualizer.create_rating_analysis_plots()
+        
+        logger.info("Generating category analysis plots...")
+        visualizer.create_category_analysis_plots()
+        
+        logger.info("Generating correlation analysis...")
+        visualizer.create_advanced_correlation_plots()
+        
+        dashboard.result()
 
 
 class AnalysisPipeline:
@@ -63,8 +135,10 @@ class AnalysisPipeline:
         
         # File paths
         self.scraped_file = self.data_dir / 'scraped_books.csv'
-        self.cleaned_file = self.data_dir / 'cleaned_books.csv'
+        self.cleaned_csv = self.data_dir / 'cleaned_books.csv'
+        self.cleaned_file = self.data_dir / 'cleaned_books.arrow' if ARROW_HANDOFF else self.cleaned_csv
         self.analysis_report = self.data_dir / f'comprehensive_analysis_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        self.analysis_report_md = self.analysis_report.with_suffix('.md')
         self.visualization_dir = self.base_dir / 'visualizations' / 'output_visualizations'
         
         # Setup logging
@@ -78,26 +152,38 @@ class AnalysisPipeline:
             'steps_completed': [],
             'errors': []
         }
+        
+        # Cleaned DataFrame kept by run_cleaner so in-process steps skip re-reading it
+        self._cleaned_df = None
+        # When True (set by run_full_pipeline) the cleaned data is only kept in memory
+        self.skip_intermediate_files = False
+        
+        # Background deletions of cleared folders, joined before the pipeline finishes
+        self._cleanup_threads: List[threading.Thread] = []
     
     def _setup_logging(self) -> None:
         """Set up logging for the pipeline."""
+        from colorama import init, Fore, Style
+        
         # Initialize colorama
         init(autoreset=True)
         
-        log_file = self.base_dir / 'pipeline.log'
+        self.log_file = self.base_dir / 'pipeline.log'
         
-        # Custom formatter with colors
+        # Custom formatter with colors; wraps the formatted line and leaves the
+        # record untouched for the other handlers
         class ColoredFormatter(logging.Formatter):
+            COLORS = {
+                logging.DEBUG: Fore.BLUE,
+                logging.INFO: Fore.GREEN,
+                logging.WARNING: Fore.YELLOW,
+                logging.ERROR: Fore.RED,
+            }
+            
             def format(self, record):
-                if record.levelno == logging.INFO:
-                    record.msg = Fore.GREEN + record.msg + Style.RESET_ALL
-                elif record.levelno == logging.WARNING:
-                    record.msg = Fore.YELLOW + record.msg + Style.RESET_ALL
-                elif record.levelno == logging.ERROR:
-                    record.msg = Fore.RED + record.msg + Style.RESET_ALL
-                elif record.levelno == logging.DEBUG:
-                    record.msg = Fore.BLUE + record.msg + Style.RESET_ALL
-                return super().format(record)
+                message = super().format(record)
+                color = self.COLORS.get(record.levelno)
+                return color + message + Style.RESET_ALL if color else message
         
         # Create logger
         self.logger = logging.getLogger('AnalysisPipeline')
@@ -108,61 +194,132 @@ class AnalysisPipeline:
             self.logger.removeHandler(handler)
         
         # File handler (no colors)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(self.log_file, delay=True)
         file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(file_formatter)
         
-        # Console handler (with colors)
+        # Console handler (with colors when writing to a terminal)
         console_handler = logging.StreamHandler(sys.stdout)
-        console_formatter = ColoredFormatter('%(asctime)s - %(levelname)s - %(message)s')
+        formatter_class = ColoredFormatter if sys.stdout.isatty() else logging.Formatter
+        console_formatter = formatter_class('%(asctime)s - %(levelname)s - %(message)s')
         console_handler.setFormatter(console_formatter)
         
-        self.logger.addHandler(file_handler)
+        # File writes are queued and done by a listener thread so log calls from the
+        # steps (and the scraper's workers) never wait on disk. The console stays
+        # synchronous to keep its order with the steps' print() output
+        # A previous instance's listener is stopped first so its thread and file don't leak
+        global _log_listener
+        _stop_log_listener()
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(log_queue, file_handler)
+        _log_listener.start()
+        
+        self.logger.addHandler(QueueHandler(log_queue))
         self.logger.addHandler(console_handler)
+        # Records are fully handled here; don't format them again in any root handlers
+        self.logger.propagate = False
     
     def _clear_data_folders(self) -> None:
         """Clear all data in data folder and output_visualizations folder."""
         # Clear data folder
         if self.data_dir.exists():
-            shutil.rmtree(self.data_dir)
+            self._discard_dir(self.data_dir)
             self.data_dir.mkdir()
             self.logger.info(f"Cleared data folder: {self.data_dir}")
         
         # Clear output visualizations folder
         if self.visualization_dir.exists():
-            shutil.rmtree(self.visualization_dir)
+            self._discard_dir(self.visualization_dir)
             self.visualization_dir.mkdir(parents=True)
             self.logger.info(f"Cleared visualizations folder: {self.visualization_dir}")
     
-    def run_scraper(self, num_pages: int = 1) -> bool:
+    def _discard_dir(self, path: Path) -> None:
+        """
+        Move a directory out of the way and delete it on a background thread.
+        
+        The rename is a single syscall, so the caller can recreate the directory
+        straight away while the old files are unlinked.
+        
+        Args:
+            path: Directory to remove
+        """
+        trash = path.with_name(f'{path.name}.trash.{os.getpid()}.{time.time_ns()}')
+        try:
+            path.rename(trash)
+        except OSError:
+            # e.g. a file inside is held open on Windows
+            shutil.rmtree(path)
+            return
+        thread = threading.Thread(target=shutil.rmtree, args=(trash,),
+                                  kwargs={'ignore_errors': True}, daemon=True)
+        thread.start()
+        self._cleanup_threads.append(thread)
+    
+    def _require_cleaned_data(self) -> Path:
+        """
+        Return the cleaned data file to read, raising FileNotFoundError unless
+        cleaned data is in memory or on disk.
+        
+        When the Arrow hand-off file is missing (e.g. a --step run on data that only
+        has cleaned_books.csv), the CSV copy is read instead.
+        """
+        if self._cleaned_df is not None or self.cleaned_file.exists():
+            return self.cleaned_file
+        if self.cleaned_csv.exists():
+            self.logger.info(f"{self.cleaned_file.name} not found, reading {self.cleaned_csv.name}")
+            return self.cleaned_csv
+        raise FileNotFoundError(f"Cleaned data file not found: {self.cleaned_file}")
+    
+    def save_cleaned_data(self) -> Path:
+        """
+        Write the in-memory cleaned data to disk, e.g. to inspect a run made with
+        skip_intermediate_files.
+        
+        Returns:
+            Path of the written file
+        """
+        if self._cleaned_df is None:
+            raise ValueError("No cleaned data in memory. Run the cleaner first.")
+        
+        from cleaner import DataCleaner
+        
+        DataCleaner().save_data(self._cleaned_df, str(self.cleaned_file))
+        return self.cleaned_file
+    
+    def run_scraper(self, num_pages: int = 1, fetch_details: bool = True) -> bool:
         """
         Step 1: Run the web scraper to collect book data.
         
         Args:
             num_pages: Number of pages to scrape
+            fetch_details: Open each book's detail page for its exact stock count. When False,
+                books are read from the category listings only (availability is 1 or 0)
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            self.logger.info("\n" + "=" * 60)
-            self.logger.info("STEP 1: RUNNING WEB SCRAPER")
-            self.logger.info("=" * 60 + "\n")
+            self.logger.info("\n" + "=" * 60 + "\nSTEP 1: RUNNING WEB SCRAPER\n" + "=" * 60 + "\n")
+            
+            from scraper import BookScraper
             
             # Initialize scraper with relative path from scraper's perspective
-            scraper = BookScraper(output_file=str(self.scraped_file), max_pages=num_pages, logger=self.logger)
+            scraper = BookScraper(output_file=str(self.scraped_file), max_pages=num_pages, logger=self.logger,
+                                  fetch_details=fetch_details)
             
             # Run scraping
             scraper.scrape_books()
             
             # Check if scraping was successful by checking if file exists and has content
             if self.scraped_file.exists():
-                import pandas as pd
                 try:
-                    df = pd.read_csv(self.scraped_file)
-                    books_count = len(df)
-                    if books_count > 0:
-                        self.logger.info(f"Successfully scraped {books_count} books")
+                    # Only check that something follows the header; the cleaner loads
+                    # the file next and reports the row count
+                    with open(self.scraped_file, 'rb') as f:
+                        f.readline()
+                        has_rows = bool(f.read(1))
+                    if has_rows:
+                        self.logger.info(f"Scraping completed ({self.scraped_file.stat().st_size} bytes)")
                         self.logger.info(f"Data saved to: {self.scraped_file}\n")
                         self.pipeline_stats['steps_completed'].append('scraping')
                         return True
@@ -190,14 +347,14 @@ class AnalysisPipeline:
             True if successful, False otherwise
         """
         try:
-            self.logger.info("\n" + "=" * 60)
-            self.logger.info("STEP 2: RUNNING DATA CLEANER")
-            self.logger.info("=" * 60 + "\n")
+            self.logger.info("\n" + "=" * 60 + "\nSTEP 2: RUNNING DATA CLEANER\n" + "=" * 60 + "\n")
             
             # Check if scraped data exists
             if not self.scraped_file.exists():
                 raise FileNotFoundError(f"Scraped data file not found: {self.scraped_file}")
             
+            from cleaner import DataCleaner
+            
             # Initialize cleaner
             cleaner = DataCleaner(
                 numerical_fill_value=0.0,
@@ -208,13 +365,22 @@ class AnalysisPipeline:
             # Process data
             cleaned_df = cleaner.process_pipeline(
                 input_path=str(self.scraped_file),
-                output_path=str(self.cleaned_file),
+                output_path=None if self.skip_intermediate_files else str(self.cleaned_file),
                 text_columns=['title', 'category'],
                 datetime_columns=[]
             )
             
+            # Later steps read the Arrow file; keep the CSV for standalone scripts and readers
+            if not self.skip_intermediate_files and self.cleaned_file != self.cleaned_csv:
+                cleaner.save_data(cleaned_df, str(self.cleaned_csv))
+            
+            # Categoricals are decoded as in the saved file, so every step sees the same data
+            categorical = cleaned_df.select_dtypes(include=['category']).columns
+            self._cleaned_df = cleaned_df.astype({col: object for col in categorical})
+            
             # Log statistics
             stats = cleaner.processing_stats
+            self.logger.info(f"Loaded {stats['initial_rows']} scraped books")
             self.logger.info(f"Cleaning completed. Final dataset: {len(cleaned_df)} rows")
             self.logger.info(f"Processing statistics: {stats}\n")
             
@@ -235,16 +401,15 @@ class AnalysisPipeline:
             True if successful, False otherwise
         """
         try:
-            self.logger.info("\n" + "=" * 60)
-            self.logger.info("STEP 3: RUNNING STATISTICAL ANALYSIS")
-            self.logger.info("=" * 60 + "\n")
+            self.logger.info("\n" + "=" * 60 + "\nSTEP 3: RUNNING STATISTICAL ANALYSIS\n" + "=" * 60 + "\n")
             
             # Check if cleaned data exists
-            if not self.cleaned_file.exists():
-                raise FileNotFoundError(f"Cleaned data file not found: {self.cleaned_file}")
+            cleaned_file = self._require_cleaned_data()
+            
+            from analyzer import BookDataAnalyzer
             
             # Initialize analyzer
-            analyzer = BookDataAnalyzer(str(self.cleaned_file))
+            analyzer = BookDataAnalyzer(str(cleaned_file), df=self._cleaned_df)
             
             # Generate comprehensive analysis
             analysis_results = analyzer.generate_comprehensive_report()
@@ -257,7 +422,7 @@ class AnalysisPipeline:
             )
             
             # Also save as markdown
-            md_report = self.analysis_report.with_suffix('.md')
+            md_report = self.analysis_report_md
             analyzer.save_report(
                 analysis_results, 
                 str(md_report),
@@ -277,43 +442,27 @@ class AnalysisPipeline:
             self.pipeline_stats['errors'].append(error_msg)
             return False
     
-    def run_visualizer(self) -> bool:
+    def run_visualizer(self, rendering: Optional[Future] = None) -> bool:
         """
         Step 4: Generate data visualizations.
         
+        Args:
+            rendering: Future of _render_visualizations already started in another
+                process; when None the figures are rendered here
+        
         Returns:
             True if successful, False otherwise
         """
         try:
-            self.logger.info("\n" + "=" * 60)
-            self.logger.info("STEP 4: GENERATING VISUALIZATIONS")
-            self.logger.info("=" * 60 + "\n")
+            self.logger.info("\n" + "=" * 60 + "\nSTEP 4: GENERATING VISUALIZATIONS\n" + "=" * 60 + "\n")
             
             # Check if cleaned data exists
-            if not self.cleaned_file.exists():
-                raise FileNotFoundError(f"Cleaned data file not found: {self.cleaned_file}")
+            cleaned_file = self._require_cleaned_data()
             
-            # Initialize visualizer
-            visualizer = BookDataVisualizer(
-                data_path=str(self.cleaned_file),
-                output_dir=str(self.visualization_dir)
-            )
-            
-            # Generate all visualizations
-            self.logger.info("Generating price distribution plots...")
-            visualizer.create_price_distribution_plots()
-            
-            self.logger.info("Generating rating analysis plots...")
-            visualizer.create_rating_analysis_plots()
-            
-            self.logger.info("Generating category analysis plots...")
-            visualizer.create_category_analysis_plots()
-            
-            self.logger.info("Generating correlation analysis...")
-            visualizer.create_advanced_correlation_plots()
-            
-            self.logger.info("Generating comprehensive dashboard...")
-            visualizer.create_interactive_plotly_dashboard()
+            if rendering is None:
+                _render_visualizations(str(cleaned_file), str(self.visualization_dir), self._cleaned_df)
+            else:
+                rendering.result()
             
             self.logger.info(f"All visualizations saved to: {self.visualization_dir}\n")
             
@@ -334,18 +483,18 @@ class AnalysisPipeline:
             True if successful, False otherwise
         """
         try:
-            self.logger.info("\n" + "=" * 60)
-            self.logger.info("STEP 5: RUNNING PREDICTIVE ANALYSIS")
-            self.logger.info("=" * 60 + "\n")
+            self.logger.info("\n" + "=" * 60 + "\nSTEP 5: RUNNING PREDICTIVE ANALYSIS\n" + "=" * 60 + "\n")
             
             # Check if cleaned data exists
-            if not self.cleaned_file.exists():
-                raise FileNotFoundError(f"Cleaned data file not found: {self.cleaned_file}")
+            cleaned_file = self._require_cleaned_data()
+            
+            from final_predictor import BookPricePredictionSystem
             
             # Initialize the prediction system
             prediction_system = BookPricePredictionSystem(
-                file_path=str(self.cleaned_file),
-                output_dir=str(self.data_dir)
+                file_path=str(cleaned_file),
+                output_dir=str(self.data_dir),
+                df=self._cleaned_df
             )
             
             # Load data
@@ -380,32 +529,37 @@ class AnalysisPipeline:
             self.pipeline_stats['errors'].append(error_msg)
             return False
     
-    def run_full_pipeline(self, num_pages: int = 1, skip_scraping: bool = False) -> Dict[str, Any]:
+    def run_full_pipeline(self, num_pages: int = 1, skip_scraping: bool = False,
+                          fetch_details: bool = True,
+                          skip_intermediate_files: bool = False) -> Dict[str, Any]:
         """
         Run the complete analysis pipeline.
         
         Args:
             num_pages: Number of pages to scrape
             skip_scraping: If True, skip scraping and use existing data
+            fetch_details: If False, scrape from listing pages only (no per-book requests)
+            skip_intermediate_files: If True, hand the cleaned data to the later steps in
+                memory without writing cleaned_books.* (see save_cleaned_data)
             
         Returns:
             Dictionary with pipeline results and statistics
         """
+        self.skip_intermediate_files = skip_intermediate_files
         self.pipeline_stats['start_time'] = datetime.now()
+        started_ns = time.monotonic_ns()
         
         # Clear existing data and visualizations
         self.logger.info("Clearing existing data and visualizations...")
         self._clear_data_folders()
         
-        self.logger.info("*" * 80)
-        self.logger.info("STARTING SOCIAL MEDIA ANALYSIS PIPELINE")
-        self.logger.info("*" * 80)
+        self.logger.info("*" * 80 + "\nSTARTING SOCIAL MEDIA ANALYSIS PIPELINE\n" + "*" * 80)
         
         success = True
         
         # Step 1: Scraping (optional)
         if not skip_scraping:
-            if not self.run_scraper(num_pages):
+            if not self.run_scraper(num_pages, fetch_details):
                 success = False
         else:
             self.logger.info("Skipping scraping step - using existing data")
@@ -419,23 +573,41 @@ class AnalysisPipeline:
         if success and not self.run_cleaner():
             success = False
         
-        # Step 3: Analysis
-        if success and not self.run_analyzer():
-            success = False
-        
-        # Step 4: Visualization
-        if success and not self.run_visualizer():
-            success = False
+        # Steps 3 and 4 only read the cleaned data and write disjoint outputs,
+        # so the figures are rendered in a second process during the analysis.
+        # The worker reads the cleaned file itself (pickling the frame over to it
+        # would cost about as much as that read) unless no file was written
+        if success:
+            with ProcessPoolExecutor(max_workers=1, initializer=_log_to_file_directly,
+                                     initargs=(str(self.log_file),)) as executor:
+                rendering = executor.submit(
+                    _render_visualizations, str(self.cleaned_file), str(self.visualization_dir),
+                    self._cleaned_df if self.skip_intermediate_files else None
+                )
+                
+                # Step 3: Analysis
+                if not self.run_analyzer():
+                    success = False
+                
+                # Step 4: Visualization
+                if not self.run_visualizer(rendering):
+                    success = False
         
         # Step 5: Predictive Analysis
         if success and not self.run_predictive_analysis():
             success = False
         
+        # The old outputs were deleted while the steps ran; make sure no trash
+        # folders are left behind when the process exits
+        for thread in self._cleanup_threads:
+            thread.join()
+        self._cleanup_threads.clear()
+        
         # Finalize pipeline
         self.pipeline_stats['end_time'] = datetime.now()
-        self.pipeline_stats['duration'] = (
-            self.pipeline_stats['end_time'] - self.pipeline_stats['start_time']
-        ).total_seconds()
+        # Start/end stay wall-clock for display; the duration comes from the monotonic
+        # clock so system clock adjustments during a run can't skew it
+        self.pipeline_stats['duration'] = (time.monotonic_ns() - started_ns) / 1e9
         
         # Log final results
         self.logger.info("*" * 80)
@@ -459,9 +631,10 @@ class AnalysisPipeline:
             'statistics': self.pipeline_stats,
             'output_files': {
                 'scraped_data': str(self.scraped_file),
-                'cleaned_data': str(self.cleaned_file),
+                'cleaned_data': None if skip_intermediate_files else str(self.cleaned_file),
+                'cleaned_data_csv': None if skip_intermediate_files else str(self.cleaned_csv),
                 'analysis_report_json': str(self.analysis_report),
-                'analysis_report_md': str(self.analysis_report.with_suffix('.md')),
+                'analysis_report_md': str(self.analysis_report_md),
                 'visualizations': str(self.visualization_dir),
                 'prediction_reports': str(self.data_dir) + '/book_price_prediction_report_*.{json,md,csv}'
             }
@@ -475,6 +648,10 @@ def main():
     parser = argparse.ArgumentParser(description='Social Media Analysis Pipeline')
     parser.add_argument('--pages', type=int, default=1, help='Number of pages to scrape (default: 5)')
     parser.add_argument('--skip-scraping', action='store_true', help='Skip scraping and use existing data')
+    parser.add_argument('--skip-details', action='store_true',
+                       help='Scrape category listings only, without opening each book page (availability becomes in stock 1/0)')
+    parser.add_argument('--skip-intermediate-files', action='store_true',
+                       help='Keep the cleaned data in memory between steps instead of writing cleaned_books.*')
     parser.add_argument('--step', choices=['scraper', 'cleaner', 'analyzer', 'visualizer', 'predictor'], 
                        help='Run only a specific step')
     
@@ -486,7 +663,7 @@ def main():
     if args.step:
         # Run specific step
         if args.step == 'scraper':
-            result = pipeline.run_scraper(args.pages)
+            result = pipeline.run_scraper(args.pages, fetch_details=not args.skip_details)
         elif args.step == 'cleaner':
             result = pipeline.run_cleaner()
         elif args.step == 'analyzer':
@@ -505,7 +682,9 @@ def main():
         # Run full pipeline
         results = pipeline.run_full_pipeline(
             num_pages=args.pages, 
-            skip_scraping=args.skip_scraping
+            skip_scraping=args.skip_scraping,
+            fetch_details=not args.skip_details,
+            skip_intermediate_files=args.skip_intermediate_files
         )
         
         if not results['success']:
@@ -7,15 +7,26 @@ Author: GitHub Copilot
 Date: September 2025
 """
 
+import argparse
 import pandas as pd
 import numpy as np
+import matplotlib
+# Figures are only written to files, so skip loading any GUI backend
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
-import plotly.express as px
+import os
+import hashlib
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional, Tuple
 import logging
 
+try:
+    # Optional: multithreaded CSV reader, used when installed
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 # Configure plotting style
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
@@ -30,34 +41,128 @@ class BookDataVisualizer:
     Simplified visualizer for book data with essential plots.
     """
 
-    def __init__(self, data_path: str, output_dir: str = "output_visualizations") -> None:
+    # Lower-cased categories counted as fiction in the fiction vs non-fiction plots
+    FICTION_CATEGORIES = frozenset({'fiction', 'historical fiction', 'mystery', 'young adult'})
+
+    # Input columns the plots use ('availability' is optional); others are not loaded
+    DATA_COLUMNS = ('price', 'rating', 'category', 'availability')
+
+    # Points drawn in the dashboard scatter; every point is embedded in the HTML
+    MAX_SCATTER_POINTS = 2000
+
+    # Report sections and the methods that build them, in report order
+    REPORT_SECTIONS = {
+        'price_analysis': 'create_price_distribution_plots',
+        'rating_analysis': 'create_rating_analysis_plots',
+        'category_analysis': 'create_category_analysis_plots',
+        'correlation_analysis': 'create_advanced_correlation_plots',
+        'comparative_analysis': 'create_comparative_analysis_plots',
+        'interactive_dashboard': 'create_interactive_plotly_dashboard'
+    }
+
+    def __init__(self, data_path: str, output_dir: str = "output_visualizations",
+                 df: Optional[pd.DataFrame] = None) -> None:
         """
         Initialize the visualizer.
 
         Args:
-            data_path: Path to the cleaned books CSV file
+            data_path: Path to the cleaned books CSV (or Arrow/Feather) file
             output_dir: Directory to save visualizations
+            df: Already loaded cleaned data; when given, data_path is not read
         """
         self.data_path = Path(data_path)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
         self.data = None
-        self._load_data()
+        self._section_results: Dict[str, Any] = {}
+        self._load_data(df)
 
-    def _load_data(self) -> None:
-        """Load and prepare data."""
+    def _load_data(self, df: Optional[pd.DataFrame] = None) -> None:
+        """Load (unless a DataFrame is given) and prepare data."""
         try:
-            self.data = pd.read_csv(self.data_path)
+            if df is not None:
+                # Shallow copy: the column updates below don't touch the caller's frame
+                self.data = df.copy(deep=False)
+            elif self.data_path.suffix in ('.arrow', '.feather'):
+                with pa.ipc.open_file(self.data_path) as reader:
+                    columns = [col for col in reader.schema.names if col in self.DATA_COLUMNS]
+                self.data = pd.read_feather(self.data_path, columns=columns)
+            elif pa is not None:
+                self.data = self._read_csv_cached()
+            else:
+                self.data = pd.read_csv(self.data_path, usecols=lambda col: col in self.DATA_COLUMNS)
             self.data['price'] = pd.to_numeric(self.data['price'], errors='coerce')
             self.data['rating'] = pd.to_numeric(self.data['rating'], errors='coerce')
             self.data['category'] = self.data['category'].fillna('Unknown')
+            is_fiction = self.data['category'].astype(str).str.lower().isin(self.FICTION_CATEGORIES)
+            self.data['book_type'] = np.where(is_fiction, 'Fiction', 'Non-Fiction')
+            self._fiction_mask = is_fiction.to_numpy()
+
+            # Aggregates shared by several plots, computed once per load
+            self._category_counts = self.data['category'].value_counts()
+            self._valid_price_rating = self.data.dropna(subset=['price', 'rating'])
+            self._category_stats = self.data.groupby('category').agg(
+                avg_price=('price', 'mean'),
+                avg_rating=('rating', 'mean')
+            )
+
+            # Price-on-rating trend line and correlation used by both scatter plots
+            valid = self._valid_price_rating
+            self._price_rating_corr = valid['rating'].corr(valid['price'])
+            self._price_rating_trend = None
+            if len(valid) > 0:
+                ratings = valid['rating'].to_numpy()
+                prices = valid['price'].to_numpy()
+                slope, intercept = np.polyfit(ratings, prices, 1)
+                x_trend = np.linspace(ratings.min(), ratings.max(), 100)
+                self._price_rating_trend = (x_trend, slope * x_trend + intercept)
 
             logger.info(f"Loaded {len(self.data)} records")
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             raise
 
+    def _read_csv_cached(self) -> pd.DataFrame:
+        """Read the CSV columns in use, via a Parquet sidecar that is rewritten when the CSV changes."""
+        # Kept in the output folder (cleared with it), not next to the data; the path
+        # hash stops two CSVs with the same name from sharing a sidecar
+        path_hash = hashlib.md5(str(self.data_path.resolve()).encode()).hexdigest()[:8]
+        sidecar = self.output_dir / '.cache' / f"{self.data_path.stem}.{path_hash}.viz.parquet"
+        if sidecar.exists() and sidecar.stat().st_mtime_ns >= self.data_path.stat().st_mtime_ns:
+            return pd.read_parquet(sidecar)
+
+        # The pyarrow engine only takes a list for usecols, so read the header first
+        header = pd.read_csv(self.data_path, nrows=0).columns
+        columns = [col for col in header if col in self.DATA_COLUMNS]
+        data = pd.read_csv(self.data_path, engine='pyarrow', usecols=columns)
+
+        # Written under a temporary name so a partial file is never picked up
+        tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+        try:
+            sidecar.parent.mkdir(exist_ok=True)
+            data.to_parquet(tmp_path, compression='zstd', index=False)
+            os.replace(tmp_path, sidecar)
+        except OSError as e:
+            logger.warning(f"Could not cache {self.data_path.name} as Parquet: {e}")
+            tmp_path.unlink(missing_ok=True)
+        return data
+
+    def _split_by_book_type(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the non-missing values of a column for fiction and non-fiction books."""
+        values = self.data[column].to_numpy()
+        present = ~pd.isna(values)
+        return values[self._fiction_mask & present], values[~self._fiction_mask & present]
+
+    @staticmethod
+    def _downsample(data: pd.DataFrame, max_points: int) -> pd.DataFrame:
+        """Sample about max_points rows, keeping each rating's share of the data."""
+        if len(data) <= max_points:
+            return data
+        frac = max_points / len(data)
+        sample = data.groupby('rating', group_keys=False).sample(frac=frac, random_state=0)
+        return sample.sort_index()
+
     def create_price_distribution_plots(self) -> Dict[str, Any]:
         """
         Create price distribution visualizations.
@@ -80,7 +185,7 @@ class BookDataVisualizer:
         ax1.legend()
 
         # Price by category (top 5)
-        top_categories = self.data['category'].value_counts().head(5).index
+        top_categories = self._category_counts.head(5).index
         filtered_data = self.data[self.data['category'].isin(top_categories)]
         sns.boxplot(data=filtered_data, x='category', y='price', ax=ax2)
         ax2.set_title('Price by Category (Top 5)')
@@ -90,7 +195,7 @@ class BookDataVisualizer:
 
         plt.tight_layout()
         plot_path = self.output_dir / 'price_distribution_analysis.png'
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=300)
         plt.close()
 
         logger.info(f"Price distribution analysis saved to: {plot_path}")
@@ -119,29 +224,28 @@ class BookDataVisualizer:
         ax1.set_ylabel('Frequency')
         ax1.set_xticks(range(1, 6))
 
-        # Rating vs price scatter
-        valid_data = self.data.dropna(subset=['rating', 'price'])
+        # Rating vs price scatter (sampled like the dashboard scatter; ratings are
+        # discrete, so extra points only overplot the same five columns)
+        valid_data = self._downsample(self._valid_price_rating, self.MAX_SCATTER_POINTS)
         ax2.scatter(valid_data['rating'], valid_data['price'], alpha=0.6)
         ax2.set_title('Rating vs Price')
         ax2.set_xlabel('Rating')
         ax2.set_ylabel('Price ($)')
 
-        # Add trend line
-        slope, intercept = np.polyfit(valid_data['rating'], valid_data['price'], 1)
-        x_trend = np.linspace(valid_data['rating'].min(), valid_data['rating'].max(), 100)
-        y_trend = slope * x_trend + intercept
-        ax2.plot(x_trend, y_trend, color='red', linewidth=2, label='Trend Line')
-        ax2.legend()
+        # Add trend line and correlation (skipped when no book has both a price and a rating)
+        correlation = self._price_rating_corr
+        if self._price_rating_trend is not None:
+            x_trend, y_trend = self._price_rating_trend
+            ax2.plot(x_trend, y_trend, color='red', linewidth=2, label='Trend Line')
+            ax2.legend()
 
-        # Add correlation
-        correlation = valid_data['rating'].corr(valid_data['price'])
-        ax2.text(0.05, 0.95, f'Correlation: {correlation:.3f}',
-                transform=ax2.transAxes, fontsize=10,
-                bbox=dict(boxstyle="round", facecolor='white', alpha=0.8))
+            ax2.text(0.05, 0.95, f'Correlation: {correlation:.3f}',
+                    transform=ax2.transAxes, fontsize=10,
+                    bbox=dict(boxstyle="round", facecolor='white', alpha=0.8))
 
         plt.tight_layout()
         plot_path = self.output_dir / 'rating_analysis.png'
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=300)
         plt.close()
 
         logger.info(f"Rating analysis saved to: {plot_path}")
@@ -164,7 +268,7 @@ class BookDataVisualizer:
         fig.suptitle('Category Analysis')
 
         # Category popularity (top 10)
-        category_counts = self.data['category'].value_counts().head(10)
+        category_counts = self._category_counts.head(10)
         ax1.bar(range(len(category_counts)), category_counts.values, alpha=0.7)
         ax1.set_title('Category Popularity (Top 10)')
         ax1.set_xlabel('Category')
@@ -173,8 +277,7 @@ class BookDataVisualizer:
         ax1.set_xticklabels(category_counts.index, rotation=45, ha='right')
 
         # Average price by category (top 10)
-        top_categories = category_counts.index
-        category_prices = self.data[self.data['category'].isin(top_categories)].groupby('category')['price'].mean()
+        category_prices = self._category_stats.loc[category_counts.index, 'avg_price'].sort_index()
         ax2.bar(range(len(category_prices)), category_prices.values, alpha=0.7, color='orange')
         ax2.set_title('Average Price by Category')
         ax2.set_xlabel('Category')
@@ -184,13 +287,13 @@ class BookDataVisualizer:
 
         plt.tight_layout()
         plot_path = self.output_dir / 'category_analysis.png'
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=300)
         plt.close()
 
         logger.info(f"Category analysis saved to: {plot_path}")
 
         return {
-            'total_categories': len(self.data['category'].unique()),
+            'total_categories': len(self._category_counts),
             'most_popular_category': category_counts.index[0],
             'category_counts': category_counts.to_dict()
         }
@@ -217,18 +320,24 @@ class BookDataVisualizer:
                 'Correlation Matrix', 'Fiction vs Non-Fiction Comparison'
             ],
             specs=[
-                [{"type": "histogram"}, {"type": "histogram"}],
+                [{"type": "bar"}, {"type": "bar"}],
                 [{"type": "scatter"}, {"type": "bar"}],
                 [{"type": "box"}, {"type": "bar"}],
                 [{"type": "heatmap"}, {"type": "box"}]
             ]
         )
 
+        # Per-book values are passed as float32 arrays, which plotly embeds in the
+        # HTML as base64 at half the size of float64. The two histograms are
+        # binned here so only the bin counts are embedded.
+
         # 1. Price Distribution Histogram
+        counts, edges = np.histogram(self.data['price'].dropna().to_numpy(), bins=20)
         fig.add_trace(
-            go.Histogram(
-                x=self.data['price'].dropna(),
-                nbinsx=20,
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
                 name='Price Distribution',
                 marker_color='lightblue',
                 showlegend=False
@@ -236,11 +345,16 @@ class BookDataVisualizer:
             row=1, col=1
         )
 
-        # 2. Rating Distribution Histogram
+        # 2. Rating Distribution Histogram (one bin per star value, including the
+        # 0 the scraper records for an unknown star class)
+        ratings = self.data['rating'].dropna().to_numpy()
+        low, high = (min(1, ratings.min()), max(5, ratings.max())) if ratings.size else (1, 5)
+        counts, edges = np.histogram(ratings, bins=np.arange(low - 0.5, high + 1))
         fig.add_trace(
-            go.Histogram(
-                x=self.data['rating'].dropna(),
-                nbinsx=5,
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
                 name='Rating Distribution',
                 marker_color='lightcoral',
                 showlegend=False
@@ -248,17 +362,19 @@ class BookDataVisualizer:
             row=1, col=2
         )
 
-        # 3. Price vs Rating Scatter Plot
-        valid_data = self.data.dropna(subset=['price', 'rating'])
+        # 3. Price vs Rating Scatter Plot (large datasets are sampled; the
+        # trend line below is still fitted on every point)
+        valid_data = self._valid_price_rating
+        scatter_data = self._downsample(valid_data, self.MAX_SCATTER_POINTS)
         fig.add_trace(
             go.Scatter(
-                x=valid_data['rating'],
-                y=valid_data['price'],
+                x=scatter_data['rating'].to_numpy('float32'),
+                y=scatter_data['price'].to_numpy('float32'),
                 mode='markers',
                 name='Price vs Rating',
-                text=valid_data['category'],
+                text=scatter_data['category'],
                 marker=dict(
-                    color=valid_data['price'],
+                    color=scatter_data['price'].to_numpy('float32'),
                     colorscale='Viridis',
                     size=8,
                     showscale=False,
@@ -271,23 +387,22 @@ class BookDataVisualizer:
         )
 
         # Add trend line to scatter
-        slope, intercept = np.polyfit(valid_data['rating'], valid_data['price'], 1)
-        x_trend = np.linspace(valid_data['rating'].min(), valid_data['rating'].max(), 100)
-        y_trend = slope * x_trend + intercept
-        fig.add_trace(
-            go.Scatter(
-                x=x_trend,
-                y=y_trend,
-                mode='lines',
-                name='Trend Line',
-                line=dict(color='red', width=2),
-                showlegend=False
-            ),
-            row=2, col=1
-        )
+        if self._price_rating_trend is not None:
+            x_trend, y_trend = self._price_rating_trend
+            fig.add_trace(
+                go.Scatter(
+                    x=x_trend,
+                    y=y_trend,
+                    mode='lines',
+                    name='Trend Line',
+                    line=dict(color='red', width=2),
+                    showlegend=False
+                ),
+                row=2, col=1
+            )
 
         # 4. Category Popularity Bar Chart
-        category_counts = self.data['category'].value_counts().head(10)
+        category_counts = self._category_counts.head(10)
         fig.add_trace(
             go.Bar(
                 x=category_counts.index,
@@ -300,13 +415,14 @@ class BookDataVisualizer:
         )
 
         # 5. Price by Category Box Plot
-        top_categories = self.data['category'].value_counts().head(10).index
+        top_categories = self._category_counts.head(10).index
         box_data = self.data[self.data['category'].isin(top_categories)]
+        category_prices = dict(tuple(box_data.groupby('category')['price']))
         for cat in top_categories:
-            cat_data = box_data[box_data['category'] == cat]['price'].dropna()
+            cat_data = category_prices[cat].dropna()
             fig.add_trace(
                 go.Box(
-                    y=cat_data,
+                    y=cat_data.to_numpy('float32'),
                     name=cat,
                     showlegend=False
                 ),
@@ -314,7 +430,7 @@ class BookDataVisualizer:
             )
 
         # 6. Average Rating by Category Bar Chart
-        category_avg_rating = self.data.groupby('category')['rating'].mean().sort_values(ascending=False).head(10)
+        category_avg_rating = self._category_stats['avg_rating'].sort_values(ascending=False).head(10)
         fig.add_trace(
             go.Bar(
                 x=category_avg_rating.index,
@@ -350,17 +466,11 @@ class BookDataVisualizer:
         )
 
         # 8. Fiction vs Non-Fiction Box Plot
-        fiction_categories = ['fiction', 'historical fiction', 'mystery', 'young adult']
-        self.data['book_type'] = self.data['category'].apply(
-            lambda x: 'Fiction' if str(x).lower() in fiction_categories else 'Non-Fiction'
-        )
-
-        fiction_ratings = self.data[self.data['book_type'] == 'Fiction']['rating'].dropna()
-        nonfiction_ratings = self.data[self.data['book_type'] == 'Non-Fiction']['rating'].dropna()
+        fiction_ratings, nonfiction_ratings = self._split_by_book_type('rating')
 
         fig.add_trace(
             go.Box(
-                y=fiction_ratings,
+                y=fiction_ratings.astype('float32'),
                 name='Fiction',
                 marker_color='skyblue',
                 showlegend=False
@@ -370,7 +480,7 @@ class BookDataVisualizer:
 
         fig.add_trace(
             go.Box(
-                y=nonfiction_ratings,
+                y=nonfiction_ratings.astype('float32'),
                 name='Non-Fiction',
                 marker_color='salmon',
                 showlegend=False
@@ -412,9 +522,11 @@ class BookDataVisualizer:
         fig.update_xaxes(title_text="Book Type", row=4, col=2)
         fig.update_yaxes(title_text="Rating", row=4, col=2)
 
-        # Save as HTML
+        # Save as HTML; plotly.js (~4.5 MB) is loaded from the CDN instead of
+        # being embedded in the file
         dashboard_path = self.output_dir / 'comprehensive_interactive_dashboard.html'
-        fig.write_html(str(dashboard_path))
+        fig.write_html(str(dashboard_path), include_plotlyjs='cdn', validate=False,
+                       config={'responsive': True})
 
         logger.info(f"Comprehensive interactive dashboard saved to: {dashboard_path}")
         return str(dashboard_path)
@@ -442,7 +554,7 @@ class BookDataVisualizer:
 
         plt.tight_layout()
         plot_path = self.output_dir / 'correlation_analysis.png'
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=300)
         plt.close()
 
         logger.info(f"Correlation analysis saved to: {plot_path}")
@@ -461,18 +573,11 @@ class BookDataVisualizer:
         """
         logger.info("Creating comparative analysis plots...")
 
-        # Define fiction vs non-fiction
-        fiction_categories = ['fiction', 'historical fiction', 'mystery', 'young adult']
-        self.data['book_type'] = self.data['category'].apply(
-            lambda x: 'Fiction' if str(x).lower() in fiction_categories else 'Non-Fiction'
-        )
-
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
         fig.suptitle('Fiction vs Non-Fiction Comparison')
 
         # Price comparison
-        fiction_prices = self.data[self.data['book_type'] == 'Fiction']['price'].dropna()
-        nonfiction_prices = self.data[self.data['book_type'] == 'Non-Fiction']['price'].dropna()
+        fiction_prices, nonfiction_prices = self._split_by_book_type('price')
 
         ax1.hist(fiction_prices, bins=10, alpha=0.7, label='Fiction', color='skyblue')
         ax1.hist(nonfiction_prices, bins=10, alpha=0.7, label='Non-Fiction', color='salmon')
@@ -482,8 +587,7 @@ class BookDataVisualizer:
         ax1.legend()
 
         # Rating comparison
-        fiction_ratings = self.data[self.data['book_type'] == 'Fiction']['rating'].dropna()
-        nonfiction_ratings = self.data[self.data['book_type'] == 'Non-Fiction']['rating'].dropna()
+        fiction_ratings, nonfiction_ratings = self._split_by_book_type('rating')
 
         ax2.boxplot([fiction_ratings, nonfiction_ratings], labels=['Fiction', 'Non-Fiction'])
         ax2.set_ylabel('Rating')
@@ -491,7 +595,7 @@ class BookDataVisualizer:
 
         plt.tight_layout()
         plot_path = self.output_dir / 'comparative_analysis.png'
-        plt.savefig(plot_path, dpi=300, bbox_inches='tight')
+        plt.savefig(plot_path, dpi=300)
         plt.close()
 
         logger.info(f"Comparative analysis saved to: {plot_path}")
@@ -499,39 +603,45 @@ class BookDataVisualizer:
         return {
             'fiction_count': len(fiction_prices),
             'nonfiction_count': len(nonfiction_prices),
-            'fiction_avg_price': fiction_prices.mean(),
-            'nonfiction_avg_price': nonfiction_prices.mean()
+            'fiction_avg_price': fiction_prices.mean() if fiction_prices.size else np.nan,
+            'nonfiction_avg_price': nonfiction_prices.mean() if nonfiction_prices.size else np.nan
         }
 
-    def generate_comprehensive_report(self) -> Dict[str, Any]:
+    def generate_comprehensive_report(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Generate comprehensive visualization report.
 
+        Args:
+            sections: REPORT_SECTIONS keys to build; all of them when None.
+                Sections built by an earlier call are reused, not redrawn.
+
         Returns:
             Dict containing all visualization results and statistics
         """
         logger.info("Generating comprehensive visualization report...")
 
+        sections = list(self.REPORT_SECTIONS) if sections is None else list(sections)
+        unknown = [key for key in sections if key not in self.REPORT_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown report sections: {unknown}. "
+                             f"Choose from: {list(self.REPORT_SECTIONS)}")
+
         try:
             report = {
                 'dataset_summary': {
                     'total_books': len(self.data),
-                    'unique_categories': len(self.data['category'].unique()),
+                    'unique_categories': len(self._category_counts),
                     'price_range': [self.data['price'].min(), self.data['price'].max()],
                     'rating_range': [self.data['rating'].min(), self.data['rating'].max()]
                 }
             }
 
-            # Generate all visualizations
-            report['price_analysis'] = self.create_price_distribution_plots()
-            report['rating_analysis'] = self.create_rating_analysis_plots()
-            report['category_analysis'] = self.create_category_analysis_plots()
-            report['correlation_analysis'] = self.create_advanced_correlation_plots()
-            report['comparative_analysis'] = self.create_comparative_analysis_plots()
-
-            # Create interactive dashboard
-            dashboard_path = self.create_interactive_plotly_dashboard()
-            report['interactive_dashboard'] = dashboard_path
+            # Generate the requested visualizations (the interactive dashboard last)
+            for key, method_name in self.REPORT_SECTIONS.items():
+                if key in sections:
+                    if key not in self._section_results:
+                        self._section_results[key] = getattr(self, method_name)()
+                    report[key] = self._section_results[key]
 
             logger.info(f"Comprehensive report generated successfully")
             logger.info(f"All visualizations saved in: {self.output_dir}")
@@ -545,13 +655,20 @@ class BookDataVisualizer:
 
 def main() -> None:
     """Main function to demonstrate the visualizer capabilities."""
+    parser = argparse.ArgumentParser(description='Book Data Visualizer')
+    parser.add_argument('--only', nargs='+', choices=list(BookDataVisualizer.REPORT_SECTIONS),
+                        metavar='SECTION',
+                        help='Build only these report sections '
+                             f'({", ".join(BookDataVisualizer.REPORT_SECTIONS)}); default: all')
+    args = parser.parse_args()
+
     try:
         # Initialize visualizer
         data_path = "../data/cleaned_books.csv"
         visualizer = BookDataVisualizer(data_path)
 
         # Generate comprehensive visualization report
-        report = visualizer.generate_comprehensive_report()
+        report = visualizer.generate_comprehensive_report(args.only)
 
         print("=== BOOK DATA VISUALIZATION REPORT ===\n")
         print(f"Dataset: {report['dataset_summary']['total_books']} books analyzed")
@@ -560,20 +677,26 @@ def main() -> None:
         print(f"Rating range: {report['dataset_summary']['rating_range'][0]} - {report['dataset_summary']['rating_range'][1]}")
 
         print("\n=== KEY FINDINGS ===")
-        print(f"Average price: ${report['price_analysis']['mean_price']:.2f}")
-        print(f"Average rating: {report['rating_analysis']['mean_rating']:.2f}")
-        print(f"Most popular category: {report['category_analysis']['most_popular_category']}")
-
-        print(f"\n=== CORRELATIONS ===")
-        print(f"Price-Rating correlation: {report['correlation_analysis']['price_rating_correlation']:.3f}")
-
-        print(f"\n=== COMPARATIVE ANALYSIS ===")
-        comp = report['comparative_analysis']
-        print(f"Fiction books: {comp['fiction_count']}")
-        print(f"Non-fiction books: {comp['nonfiction_count']}")
+        if 'price_analysis' in report:
+            print(f"Average price: ${report['price_analysis']['mean_price']:.2f}")
+        if 'rating_analysis' in report:
+            print(f"Average rating: {report['rating_analysis']['mean_rating']:.2f}")
+        if 'category_analysis' in report:
+            print(f"Most popular category: {report['category_analysis']['most_popular_category']}")
+
+        if 'correlation_analysis' in report:
+            print(f"\n=== CORRELATIONS ===")
+            print(f"Price-Rating correlation: {report['correlation_analysis']['price_rating_correlation']:.3f}")
+
+        if 'comparative_analysis' in report:
+            print(f"\n=== COMPARATIVE ANALYSIS ===")
+            comp = report['comparative_analysis']
+            print(f"Fiction books: {comp['fiction_count']}")
+            print(f"Non-fiction books: {comp['nonfiction_count']}")
 
         print(f"\n=== OUTPUT FILES ===")
-        print(f"Interactive dashboard: {report['interactive_dashboard']}")
+        if 'interactive_dashboard' in report:
+            print(f"Interactive dashboard: {report['interactive_dashboard']}")
         print(f"All visualizations saved in: output_visualizations/")
 
     except Exception as e: